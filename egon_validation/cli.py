@@ -8,8 +8,8 @@ from egon_validation.config import (
     build_db_url,
 )
 from egon_validation.context import RunContext
-from egon_validation.db import make_engine
-from egon_validation.runner.execute import run_for_task
+from egon_validation.db import DEFAULT_POOL_SIZE, make_engine
+from egon_validation.runner.execute import run_for_task, DEFAULT_MAX_WORKERS
 from egon_validation.runner.coverage_analysis import discover_total_tables
 from egon_validation.runner.aggregate import (
     collect,
@@ -23,6 +23,17 @@ import egon_validation.rules.formal  # noqa: F401
 import egon_validation.rules.custom  # noqa: F401
 
 
+def _positive_int(value):
+    """argparse type for options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def _save_table_count(ctx, total_tables):
     """Save table count to metadata file for use in final report"""
     tasks_dir = os.path.join(ctx.out_dir, ctx.run_id, "tasks")
@@ -41,6 +52,8 @@ def _run_task(args):
         )
 
     ctx = RunContext(run_id=args.run_id, out_dir=args.out)
+    # One pooled connection per rule worker, plus one for the main thread
+    pool_size = max(DEFAULT_POOL_SIZE, args.max_workers + 1)
 
     # Use SSH tunnel if configured and --with-tunnel flag is set
     if args.with_tunnel and all(
@@ -48,20 +61,32 @@ def _run_task(args):
     ):
         print("Starting SSH tunnel...")
         with create_tunnel_from_env():
-            engine = make_engine(db_url, echo=args.echo_sql)
+            engine = make_engine(db_url, echo=args.echo_sql, pool_size=pool_size)
             try:
-                run_for_task(engine, ctx, args.task)
+                run_for_task(
+                    engine,
+                    ctx,
+                    args.task,
+                    max_workers=args.max_workers,
+                    batch_by_table=args.batch_by_table,
+                )
                 # Capture table count while DB is accessible
-                total_tables = discover_total_tables()
+                total_tables = discover_total_tables(engine)
                 _save_table_count(ctx, total_tables)
             finally:
                 engine.dispose()
     else:
-        engine = make_engine(db_url, echo=args.echo_sql)
+        engine = make_engine(db_url, echo=args.echo_sql, pool_size=pool_size)
         try:
-            run_for_task(engine, ctx, args.task)
+            run_for_task(
+                engine,
+                ctx,
+                args.task,
+                max_workers=args.max_workers,
+                batch_by_table=args.batch_by_table,
+            )
             # Capture table count while DB is accessible
-            total_tables = discover_total_tables()
+            total_tables = discover_total_tables(engine)
             _save_table_count(ctx, total_tables)
         finally:
             engine.dispose()
@@ -70,7 +95,7 @@ def _run_task(args):
 
 
 def _final_report(args):
-    ctx = RunContext(run_id=args.run_id, out_dir=args.out)
+    ctx = RunContext(run_id=args.run_id, out_dir=args.out, offline=args.offline)
     collected = collect(ctx)
     coverage = build_coverage(ctx, collected)
     out_dir = write_outputs(ctx, collected, coverage)
@@ -104,6 +129,17 @@ def main():
         action="store_true",
         help="Echo SQLAlchemy SQL for debugging",
     )
+    p1.add_argument(
+        "--max-workers",
+        type=_positive_int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of rules executed concurrently (default: {DEFAULT_MAX_WORKERS})",
+    )
+    p1.add_argument(
+        "--batch-by-table",
+        action="store_true",
+        help="Fetch all SQL rules on the same table with one query",
+    )
     p1.set_defaults(func=_run_task)
 
     p2 = subs.add_parser(
@@ -116,6 +152,11 @@ def main():
         action="store_true",
         help="Print registered rules before building report",
     )
+    p2.add_argument(
+        "--offline",
+        action="store_true",
+        help="Do not connect to the database (no table count discovery)",
+    )
     p2.set_defaults(func=_final_report)
 
     args = p.parse_args()
@@ -69,6 +69,9 @@ MV_GRID_DISTRICTS_COUNT = 3854
 # SRIDValidation
 DEFAULT_SRID = 4326
 
+# Maximum number of distinct values listed in failure details
+DETAILS_DISTINCT_LIMIT = 10
+
 # Tolerances
 BALANCE_CHECK_TOLERANCE = 0.0
 DISAGGREGATED_DEMAND_TOLERANCE = 0.01
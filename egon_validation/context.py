@@ -20,6 +20,7 @@ class RunContext:
     extra: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.now)
     source: str = "manual"  # manual, airflow, api, etc.
+    offline: bool = False  # Never connect to the database while aggregating
 
 
 class RunContextFactory:
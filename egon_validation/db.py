@@ -22,12 +22,16 @@ DEFAULT_MAX_OVERFLOW = 3
 POOL_RECYCLE_SECONDS = 1800
 
 
-def make_engine(db_url: str, echo: bool = False) -> Engine:
+def make_engine(
+    db_url: str, echo: bool = False, pool_size: int = DEFAULT_POOL_SIZE
+) -> Engine:
     """Create SQLAlchemy engine with connection pooling.
 
     Args:
         db_url: Database connection URL
         echo: If True, log all SQL statements
+        pool_size: Connections kept open; should be at least the number of
+            rule workers + 1 so no worker opens a connection per query
 
     Returns:
         Configured SQLAlchemy Engine with connection pooling
@@ -35,7 +39,7 @@ def make_engine(db_url: str, echo: bool = False) -> Engine:
     return create_engine(
         db_url,
         echo=echo,
-        pool_size=DEFAULT_POOL_SIZE,
+        pool_size=pool_size,
         max_overflow=DEFAULT_MAX_OVERFLOW,
         pool_pre_ping=True,  # Verify connection health before using
         pool_recycle=POOL_RECYCLE_SECONDS,
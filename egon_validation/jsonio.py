@@ -0,0 +1,76 @@
+"""JSON helpers for result files, using orjson when it is installed.
+
+orjson is optional (``pip install -e ".[fast]"``). Values orjson cannot
+encode fall back to the standard library, so output never depends on it.
+Non-finite floats (NaN, Infinity) are written as null by both backends, so
+results.json stays valid JSON for the report; files written by older versions
+with bare NaN tokens are still read.
+"""
+
+import json
+import math
+from typing import IO, Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+# Same output shape as orjson: no whitespace, non-ASCII kept as UTF-8
+# allow_nan=False makes non-finite floats raise, see _finite()
+_COMPACT = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
+def _finite(obj: Any) -> Any:
+    """Copy obj with NaN and Infinity replaced by None, as orjson writes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    return obj
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document from str or bytes."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity tokens; json.loads accepts them
+            pass
+    return json.loads(data)
+
+
+def load(f: IO) -> Any:
+    """Decode a JSON document from an open file."""
+    return loads(f.read())
+
+
+def dumps(obj: Any) -> str:
+    """Encode obj as a compact single line, e.g. one JSONL record."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+    try:
+        return _COMPACT.encode(obj)
+    except ValueError:
+        return _COMPACT.encode(_finite(obj))
+
+
+def dump(obj: Any, f: IO[str]) -> None:
+    """Write obj to a text file, indented by 2 spaces and UTF-8 (not escaped)."""
+    if orjson is not None:
+        try:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8"))
+            return
+        except TypeError:
+            pass
+    try:
+        text = json.dumps(obj, ensure_ascii=False, indent=2, allow_nan=False)
+    except ValueError:
+        text = json.dumps(_finite(obj), ensure_ascii=False, indent=2)
+    f.write(text)
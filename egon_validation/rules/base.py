@@ -1,8 +1,9 @@
 """Base classes for validation rules: Rule, SqlRule, RuleResult, and Severity enum."""
 
+import functools
 from dataclasses import dataclass, asdict
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Type
 
 
 # PostgreSQL type mappings for data type validation
@@ -79,7 +80,46 @@ class RuleResult:
         return d
 
 
+def static_query(get_query: Callable) -> Callable:
+    """Memoize ``get_query`` for rules whose SQL depends only on ``params``.
+
+    The query is built on the first call and cached on the instance, so
+    later calls skip the string formatting. ``ctx`` is ignored once cached.
+    """
+
+    @functools.wraps(get_query)
+    def wrapper(self, ctx) -> str:
+        if self._query_cache is None:
+            self._query_cache = get_query(self, ctx)
+        return self._query_cache
+
+    return wrapper
+
+
+# Every Rule subclass, recorded when its class statement runs; see
+# Rule.__init_subclass__ and rule_subclasses().
+_RULE_SUBCLASSES: List[Type["Rule"]] = []
+
+
 class Rule:
+    # Slotted: register_map can produce many instances, and none of them
+    # need attributes beyond these.
+    __slots__ = (
+        "rule_id",
+        "task",
+        "kind",
+        "table",
+        "message_suffix",
+        "params",
+        "schema",
+        "table_name",
+        "_query_cache",
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _RULE_SUBCLASSES.append(cls)
+
     def __init__(
         self,
         rule_id: str,
@@ -96,14 +136,16 @@ class Rule:
         self.params: Dict[str, Any] = params
         # Parse schema and table_name for debug/filtering
         self.schema, self.table_name = self._parse_table_name(table)
+        self._query_cache: Optional[str] = None
 
-    def _infer_kind_from_module(self) -> str:
+    @classmethod
+    def _infer_kind_from_module(cls) -> str:
         """
         Gets kind from module name.
         Expects pattern like: '...rules.custom.meine_regel'
         oder '...rules.formal.meine_regel'.
         """
-        module_name = self.__class__.__module__
+        module_name = cls.__module__
         marker = ".rules."
         if marker in module_name:
             after_rules = module_name.split(marker, 1)[1]
@@ -282,25 +324,34 @@ class Rule:
         """Return SQL query for validation. Must be overridden by subclasses."""
         raise NotImplementedError
 
-    def _check_table_empty(self, engine, ctx) -> Optional[RuleResult]:
+    def _check_table_empty(
+        self, engine, ctx, table_rows: Optional[Dict[str, bool]] = None
+    ) -> Optional[RuleResult]:
         """Check if the table is empty and return failure result if so.
 
         Args:
             engine: SQLAlchemy engine
             ctx: Run context
+            table_rows: Optional table -> has rows map shared by the rules of
+                one run, so each table is only probed once
 
         Returns:
             RuleResult if table is empty, None if table has data
         """
         try:
-            count_query = f"SELECT COUNT(*) as total_count FROM {self.table}"
+            has_rows = table_rows.get(self.table) if table_rows is not None else None
+            if has_rows is None:
+                # EXISTS stops at the first row instead of counting the table
+                exists_query = f"SELECT EXISTS (SELECT 1 FROM {self.table}) AS has_rows"
 
-            from egon_validation import db
+                from egon_validation import db
 
-            count_row = db.fetch_one(engine, count_query)
-            total_count = int(count_row.get("total_count", 0))
+                exists_row = db.fetch_one(engine, exists_query)
+                has_rows = bool(exists_row.get("has_rows"))
+                if table_rows is not None:
+                    table_rows[self.table] = has_rows
 
-            if total_count == 0:
+            if not has_rows:
                 return self.empty_table_result()
 
             return None  # Table has data, continue normal validation
@@ -311,6 +362,27 @@ class Rule:
 
 
 class SqlRule(Rule):
+    __slots__ = ()
+
+    def get_details_query(self, ctx) -> Optional[str]:
+        """Return a follow-up query for diagnostic columns, or None.
+
+        Expensive debug aggregates (e.g. ``array_agg(DISTINCT ...)``) only
+        matter when a rule fails. Rules can move them here; the runner then
+        executes this query only after a failed ``postprocess``, merges its
+        row into the main row and calls ``postprocess`` again.
+        """
+        return None
+
+    def get_recommended_indexes(self) -> List[str]:
+        """Return ``CREATE INDEX`` statements that speed up this rule's query.
+
+        Callers collect these from their rule instances and run them as a
+        migration; see docs/pipeline-integration.md. Statements should use
+        ``CONCURRENTLY IF NOT EXISTS`` so they are safe to re-run on a live
+        database. Default: none.
+        """
+        return []
 
     def postprocess(self, row: Dict[str, Any], ctx) -> RuleResult:
         raise NotImplementedError
@@ -335,6 +407,8 @@ class SqlRule(Rule):
 class DataFrameRule(Rule):
     """Base class for DataFrame-based validation rules."""
 
+    __slots__ = ()
+
     def get_query(self, ctx) -> str:
         """Default: fetch all rows from table. Override for filtering/specific columns."""
         return f"SELECT * FROM {self.table}"
@@ -368,3 +442,8 @@ class DataFrameRule(Rule):
             return self.error_result(
                 message=f"DataFrame rule execution failed: {str(e)}"
             )
+
+
+def rule_subclasses() -> List[Type[Rule]]:
+    """All Rule subclasses defined so far, in definition order."""
+    return list(_RULE_SUBCLASSES)
@@ -1,4 +1,4 @@
-from egon_validation.rules.base import SqlRule, Severity
+from egon_validation.rules.base import SqlRule, Severity, static_query
 from egon_validation.rules.registry import register
 from egon_validation.config import (
     ELECTRICAL_LOAD_EXPECTED_VALUES,
@@ -15,6 +15,9 @@ from egon_validation.config import (
 class ElectricalLoadAggregationValidation(SqlRule):
     """Validates sum, max, min of electrical load profiles against expected values."""
 
+    __slots__ = ()
+
+    @static_query
     def get_query(self, ctx):
         base_query = """
         SELECT
@@ -150,6 +153,9 @@ class ElectricalLoadAggregationValidation(SqlRule):
 class DisaggregatedDemandSumValidation(SqlRule):
     """Validates that sum of disaggregated demands matches original aggregated value."""
 
+    __slots__ = ()
+
+    @static_query
     def get_query(self, ctx):
         sector = self.params.get("sector", "residential")
 
@@ -1,7 +1,8 @@
 """Custom validation for grouped row count comparisons against reference tables."""
 
-from egon_validation.rules.base import SqlRule
+from egon_validation.rules.base import SqlRule, static_query
 from egon_validation.rules.registry import register
+from egon_validation.rules.sql_helpers import count_filter
 
 
 @register(
@@ -40,6 +41,9 @@ class RowCountComparisonValidation(SqlRule):
         ... )
     """
 
+    __slots__ = ()
+
+    @static_query
     def get_query(self, ctx):
         reference_dataset = self.params.get("reference_dataset")
         reference_filter = self.params.get("reference_filter", "TRUE")
@@ -64,8 +68,8 @@ class RowCountComparisonValidation(SqlRule):
         SELECT
             r.ref_count,
             COUNT(g.group_count) AS total_groups,
-            COUNT(CASE WHEN g.group_count = r.ref_count THEN 1 END) AS matching_groups,
-            COUNT(CASE WHEN g.group_count != r.ref_count THEN 1 END) AS mismatching_groups,
+            {count_filter("g.group_count = r.ref_count", "matching_groups")},
+            {count_filter("g.group_count != r.ref_count", "mismatching_groups")},
             array_agg(DISTINCT g.group_count) AS found_counts
         FROM reference_count r
         CROSS JOIN grouped_counts g
@@ -1,6 +1,10 @@
-from egon_validation.rules.base import SqlRule
+from egon_validation.rules.base import SqlRule, static_query
 from egon_validation.rules.registry import register, register_map
-from egon_validation.config import ARRAY_CARDINALITY_ANNUAL_HOURS
+from egon_validation.rules.sql_helpers import count_filter
+from egon_validation.config import (
+    ARRAY_CARDINALITY_ANNUAL_HOURS,
+    DETAILS_DISTINCT_LIMIT,
+)
 
 
 @register(
@@ -30,6 +34,9 @@ class ArrayCardinalityValidation(SqlRule):
         ... )
     """
 
+    __slots__ = ()
+
+    @static_query
     def get_query(self, ctx):
         array_col = self.params.get("array_column", "values")
         expected_length = int(
@@ -39,10 +46,9 @@ class ArrayCardinalityValidation(SqlRule):
         base_query = f"""
         SELECT
             COUNT(*) as total_rows,
-            COUNT(CASE WHEN cardinality({array_col}) = {expected_length} THEN 1 END) as correct_length,
-            COUNT(CASE WHEN cardinality({array_col}) != {expected_length} THEN 1 END) as wrong_length,
-            COUNT(CASE WHEN {array_col} IS NULL THEN 1 END) as null_arrays,
-            array_agg(DISTINCT cardinality({array_col})) as found_lengths,
+            {count_filter(f"cardinality({array_col}) = {expected_length}", "correct_length")},
+            {count_filter(f"cardinality({array_col}) != {expected_length}", "wrong_length")},
+            {count_filter(f"{array_col} IS NULL", "null_arrays")},
             MIN(cardinality({array_col})) as min_length,
             MAX(cardinality({array_col})) as max_length,
             AVG(cardinality({array_col})) as avg_length
@@ -51,6 +57,18 @@ class ArrayCardinalityValidation(SqlRule):
 
         return base_query
 
+    def get_details_query(self, ctx):
+        # Sample of distinct lengths; min/max are already in the main query
+        array_col = self.params.get("array_column", "values")
+        return f"""
+        SELECT array_agg(length ORDER BY length) as found_lengths
+        FROM (
+            SELECT DISTINCT cardinality({array_col}) AS length
+            FROM {self.table}
+            LIMIT {DETAILS_DISTINCT_LIMIT}
+        ) lengths
+        """
+
     def postprocess(self, row, ctx):
         total_rows = int(row.get("total_rows") or 0)
         wrong_length = int(row.get("wrong_length") or 0)
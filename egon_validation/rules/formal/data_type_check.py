@@ -2,6 +2,7 @@ from egon_validation.rules.base import (
     SqlRule,
     POSTGRES_TYPE_MAPPINGS,
     Severity,
+    static_query,
 )
 from egon_validation.rules.registry import register
 
@@ -38,6 +39,9 @@ class DataTypeValidation(SqlRule):
         ... )
     """
 
+    __slots__ = ()
+
+    @static_query
     def get_query(self, ctx):
         # Modify the query to aggregate all results into a single row with JSON
         column_types = self.params.get("column_types", {})
@@ -1,5 +1,6 @@
-from egon_validation.rules.base import SqlRule, Severity
+from egon_validation.rules.base import SqlRule, Severity, static_query
 from egon_validation.rules.registry import register
+from egon_validation.rules.sql_helpers import count_filter
 
 
 @register(
@@ -15,12 +16,19 @@ from egon_validation.rules.registry import register
 class GeometryContainmentValidation(SqlRule):
     """Validates that point geometries are contained within reference polygon geometries."""
 
+    __slots__ = ()
+
+    @static_query
     def get_query(self, ctx):
         geom_col = self.params.get("geom", "geom")
         ref_table = self.params.get("ref_table")
         ref_geom_col = self.params.get("ref_geom", "geometry")
         ref_filter = self.params.get("ref_filter", "TRUE")
         filter_condition = self.params.get("filter_condition", "TRUE")
+        contains = (
+            "ST_Contains(reference_geom.unified_geom, "
+            f"ST_Transform(points.{geom_col}, 3035))"
+        )
 
         base_query = f"""
         WITH reference_geom AS (
@@ -30,8 +38,8 @@ class GeometryContainmentValidation(SqlRule):
         )
         SELECT
             COUNT(*) as total_points,
-            COUNT(CASE WHEN ST_Contains(reference_geom.unified_geom, ST_Transform(points.{geom_col}, 3035)) THEN 1 END) as points_inside,
-            COUNT(CASE WHEN NOT ST_Contains(reference_geom.unified_geom, ST_Transform(points.{geom_col}, 3035)) THEN 1 END) as points_outside
+            {count_filter(contains, "points_inside")},
+            {count_filter(f"NOT {contains}", "points_outside")}
         FROM
             reference_geom,
             {self.table} AS points
@@ -1,4 +1,4 @@
-from egon_validation.rules.base import Rule, SqlRule, Severity
+from egon_validation.rules.base import Rule, SqlRule, Severity, static_query
 from egon_validation.rules.registry import register
 
 
@@ -34,6 +34,9 @@ class NotNullAndNotNaNValidation(SqlRule):
         ... )
     """
 
+    __slots__ = ()
+
+    @static_query
     def get_query(self, ctx):
         columns = self.params.get("columns", [])
         if not columns:
@@ -134,6 +137,8 @@ class WholeTableNotNullAndNotNaNValidation(Rule):
         ... )
     """
 
+    __slots__ = ()
+
     def evaluate(self, engine, ctx):
         """Execute rule by querying all columns and checking each one."""
         from egon_validation import db
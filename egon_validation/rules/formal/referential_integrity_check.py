@@ -1,4 +1,7 @@
-from egon_validation.rules.base import SqlRule, Severity
+from typing import List
+
+from egon_validation.rules.base import SqlRule, Severity, static_query
+from egon_validation.rules.sql_helpers import index_name
 
 
 class ReferentialIntegrityValidation(SqlRule):
@@ -23,6 +26,9 @@ class ReferentialIntegrityValidation(SqlRule):
         ... )
     """
 
+    __slots__ = ()
+
+    @static_query
     def get_query(self, ctx):
         foreign_col = self.params.get("fk_column", "id")
         ref_table = self.params.get("ref_table")
@@ -42,6 +48,17 @@ class ReferentialIntegrityValidation(SqlRule):
 
         return base_query
 
+    def get_recommended_indexes(self) -> List[str]:
+        # Tables checked here have no FK constraint, so the referenced
+        # column is not guaranteed to be indexed for the join probe.
+        ref_table = self.params.get("ref_table")
+        reference_col = self.params.get("ref_column", "id")
+        return [
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            f"{index_name(ref_table, reference_col)} "
+            f"ON {ref_table} ({reference_col})"
+        ]
+
     def postprocess(self, row, ctx):
         total_non_null_references = int(row.get("total_non_null_references") or 0)
         orphaned_references = int(row.get("orphaned_references") or 0)
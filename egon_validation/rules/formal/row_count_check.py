@@ -1,4 +1,4 @@
-from egon_validation.rules.base import SqlRule
+from egon_validation.rules.base import SqlRule, static_query
 from egon_validation.rules.registry import register
 from egon_validation.config import MV_GRID_DISTRICTS_COUNT
 
@@ -26,6 +26,9 @@ class RowCountValidation(SqlRule):
         ... )
     """
 
+    __slots__ = ()
+
+    @static_query
     def get_query(self, ctx):
         return f"SELECT COUNT(*) AS actual_count FROM {self.table}"
 
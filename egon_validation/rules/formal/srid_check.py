@@ -1,6 +1,7 @@
-from egon_validation.rules.base import SqlRule, Severity
+from egon_validation.rules.base import SqlRule, Severity, static_query
 from egon_validation.rules.registry import register
-from egon_validation.config import DEFAULT_SRID
+from egon_validation.rules.sql_helpers import count_filter
+from egon_validation.config import DEFAULT_SRID, DETAILS_DISTINCT_LIMIT
 
 
 @register(
@@ -10,11 +11,14 @@ from egon_validation.config import DEFAULT_SRID
     geom="geom",
 )
 class SRIDUniqueNonZero(SqlRule):
+    __slots__ = ()
+
+    @static_query
     def get_query(self, ctx):
         geom = self.params.get("geom", "geom")
         return f"""
         SELECT COUNT(DISTINCT ST_SRID({geom})) AS srids,
-               SUM(CASE WHEN ST_SRID({geom}) = 0 THEN 1 ELSE 0 END) AS srid_zero
+               {count_filter(f"ST_SRID({geom}) = 0", "srid_zero")}
         FROM {self.table}
         """
 
@@ -36,6 +40,9 @@ class SRIDUniqueNonZero(SqlRule):
 class SRIDSpecificValidation(SqlRule):
     """Validates that geometry column has a specific expected SRID."""
 
+    __slots__ = ()
+
+    @static_query
     def get_query(self, ctx):
         geom = self.params.get("geom", "geom")
         expected_srid = self.params.get("expected_srid", DEFAULT_SRID)
@@ -44,14 +51,24 @@ class SRIDSpecificValidation(SqlRule):
         SELECT
             COUNT(*) AS total_geometries,
             COUNT(DISTINCT ST_SRID({geom})) AS unique_srids,
-            SUM(CASE WHEN ST_SRID({geom}) = {expected_srid} THEN 1 ELSE 0 END) AS correct_srid_count,
-            SUM(CASE WHEN ST_SRID({geom}) = 0 THEN 1 ELSE 0 END) AS zero_srid_count,
-            array_agg(DISTINCT ST_SRID({geom})) AS found_srids
+            {count_filter(f"ST_SRID({geom}) = {expected_srid}", "correct_srid_count")},
+            {count_filter(f"ST_SRID({geom}) = 0", "zero_srid_count")}
         FROM {self.table}
         """
 
         return base_query
 
+    def get_details_query(self, ctx):
+        geom = self.params.get("geom", "geom")
+        return f"""
+        SELECT array_agg(srid ORDER BY srid) AS found_srids
+        FROM (
+            SELECT DISTINCT ST_SRID({geom}) AS srid
+            FROM {self.table}
+            LIMIT {DETAILS_DISTINCT_LIMIT}
+        ) srids
+        """
+
     def postprocess(self, row, ctx):
         total_geometries = int(row.get("total_geometries") or 0)
         unique_srids = int(row.get("unique_srids") or 0)
@@ -1,5 +1,6 @@
-from egon_validation.rules.base import SqlRule, Severity
+from egon_validation.rules.base import SqlRule, Severity, static_query
 from egon_validation.rules.registry import register
+from egon_validation.rules.sql_helpers import count_filter
 
 
 @register(
@@ -29,19 +30,35 @@ class ValueSetValidation(SqlRule):
         ... )
     """
 
+    __slots__ = ()
+
+    @property
+    def _expected_set(self):
+        # Read from params on each use: a pipeline may resolve
+        # expected_values after the rule is constructed.
+        return frozenset(self.params.get("expected_values", []))
+
+    @static_query
     def get_query(self, ctx):
         col = self.params.get("column", "value")
-        expected_values = self.params.get("expected_values", [])
-
-        # Create SQL array literal for PostgreSQL
-        expected_array = "ARRAY[" + ",".join([f"'{v}'" for v in expected_values]) + "]"
+        # SQL array literal for PostgreSQL with quotes escaped. The cast
+        # keeps an empty list valid (ARRAY[] alone has no type).
+        expected_array = (
+            "ARRAY["
+            + ",".join(
+                "'" + str(v).replace("'", "''") + "'"
+                for v in self.params.get("expected_values", [])
+            )
+            + "]::text[]"
+        )
+        invalid = f"NOT ({col} = ANY({expected_array})) OR {col} IS NULL"
 
         base_query = f"""
         SELECT
             COUNT(*) as total_rows,
-            COUNT(CASE WHEN {col} = ANY({expected_array}) THEN 1 END) as valid_values,
-            COUNT(CASE WHEN {col} NOT IN (SELECT unnest({expected_array})) OR {col} IS NULL THEN 1 END) as invalid_values,
-            array_agg(DISTINCT {col}) FILTER (WHERE {col} NOT IN (SELECT unnest({expected_array})) OR {col} IS NULL) as invalid_distinct
+            {count_filter(f"{col} = ANY({expected_array})", "valid_values")},
+            {count_filter(invalid, "invalid_values")},
+            array_agg(DISTINCT {col}) FILTER (WHERE {invalid}) as invalid_distinct
         FROM {self.table}
         """
 
@@ -50,8 +67,11 @@ class ValueSetValidation(SqlRule):
     def postprocess(self, row, ctx):
         total_rows = int(row.get("total_rows") or 0)
         invalid_values = int(row.get("invalid_values") or 0)
-        invalid_distinct = row.get("invalid_distinct", [])
         expected_values = self.params.get("expected_values", [])
+        expected_set = self._expected_set
+        invalid_distinct = [
+            v for v in row.get("invalid_distinct") or [] if v not in expected_set
+        ]
 
         ok = invalid_values == 0
 
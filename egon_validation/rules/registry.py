@@ -1,10 +1,32 @@
 """Rule registration and discovery system."""
 
-from typing import Any, Dict, Iterable, List, Tuple, Type
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 from .base import Rule
 
-# Internal registry: (rule_id, task, table, rule_cls, defaults)
-_REGISTRY: List[Tuple[str, str, str, Type[Rule], Dict[str, Any]]] = []
+RegistryEntry = Tuple[str, str, str, Type[Rule], Dict[str, Any]]
+
+# Internal registry in registration order: (rule_id, task, table, rule_cls, defaults)
+_REGISTRY: List[RegistryEntry] = []
+
+# Same entries indexed by task, so rules_for() does not scan every registration.
+# Buckets stay lists: pipeline projects register rules after the built-in
+# ones, and callers only ever see fresh instances or copies.
+_BY_TASK: Dict[str, List[RegistryEntry]] = defaultdict(list)
+
+# Secondary indexes by rule kind ("formal", "custom", ...), which only depends
+# on the rule class and is resolved once at registration:
+# (task, kind) -> positions in _BY_TASK[task], kind -> entries.
+_BY_TASK_KIND: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+_BY_KIND: Dict[str, List[RegistryEntry]] = defaultdict(list)
+
+
+def _add(entry: RegistryEntry) -> None:
+    _REGISTRY.append(entry)
+    task, kind = entry[1], entry[3]._infer_kind_from_module()
+    _BY_TASK_KIND[(task, kind)].append(len(_BY_TASK[task]))
+    _BY_TASK[task].append(entry)
+    _BY_KIND[kind].append(entry)
 
 
 def register(
@@ -19,7 +41,7 @@ def register(
     def _decorator(rule_cls: Type[Rule]):
         rid = rule_id or rule_cls.__name__
         params = dict(default_params)
-        _REGISTRY.append((rid, task, table, rule_cls, params))
+        _add((rid, task, table, rule_cls, params))
         return rule_cls
 
     return _decorator
@@ -36,37 +58,43 @@ def register_map(
     rid = rule_id or rule_cls.__name__
     for tbl, params in tables_params.items():
         p = dict(params)
-        _REGISTRY.append((rid, task, tbl, rule_cls, p))
-
-
-def rules_for(task: str) -> Iterable[Rule]:
-    """Get all rules registered for task."""
-    for rid, tid, tbl, cls, params in _REGISTRY:
-        if tid == task:
-            inst = cls(rid, tbl, tid, **params)
-            yield inst
-
-
-def list_registered() -> List[Dict[str, Any]]:
-    """List all registered rules."""
-    result: List[Dict[str, Any]] = []
-
-    for rid, tid, tbl, cls, params in _REGISTRY:
-        rule = cls(
-            rule_id=rid,
-            table=tbl,
-            task=tid,
-            **params,
-        )
-
-        result.append(
-            {
-                "rule_id": rid,
-                "task": tid,
-                "table": tbl,
-                "kind": rule.kind,
-                "params": params,
-            }
-        )
-
-    return result
+        _add((rid, task, tbl, rule_cls, p))
+
+
+def _build(task: str, idx: int) -> Rule:
+    """Instantiate the idx-th rule registered for task."""
+    rid, tid, tbl, cls, params = _BY_TASK[task][idx]
+    return cls(rid, tbl, tid, **params)
+
+
+def rules_for(task: str, kind: Optional[str] = None) -> Iterable[Rule]:
+    """Get all rules registered for task, optionally only those of kind.
+
+    Every call returns fresh instances: the runner sets per-run state on
+    them (task, cached query). Rules of other kinds are not instantiated.
+    """
+    if kind is None:
+        indices: Iterable[int] = range(len(_BY_TASK.get(task, ())))
+    else:
+        indices = _BY_TASK_KIND.get((task, kind), ())
+    for idx in indices:
+        yield _build(task, idx)
+
+
+def list_registered(kind: Optional[str] = None) -> List[Dict[str, Any]]:
+    """List all registered rules, optionally only those of kind."""
+    if kind is None:
+        entries: Iterable[RegistryEntry] = _REGISTRY
+    else:
+        entries = _BY_KIND.get(kind, ())
+
+    return [
+        {
+            "rule_id": rid,
+            "task": tid,
+            "table": tbl,
+            "kind": cls._infer_kind_from_module(),
+            "params": params,
+        }
+        for rid, tid, tbl, cls, params in entries
+    ]
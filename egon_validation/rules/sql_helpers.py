@@ -0,0 +1,28 @@
+"""Helpers for building SQL fragments shared by rule queries."""
+
+
+def count_filter(predicate: str, alias: str) -> str:
+    """Return ``COUNT(*) FILTER (WHERE predicate) AS alias``.
+
+    Preferred over ``COUNT(CASE WHEN ... THEN 1 END)`` and
+    ``SUM(CASE WHEN ... THEN 1 ELSE 0 END)``: the predicate is applied by the
+    aggregate itself and the count is 0 (not NULL) on empty input.
+
+    Example:
+        >>> count_filter("ST_SRID(geom) = 0", "srid_zero")
+        'COUNT(*) FILTER (WHERE ST_SRID(geom) = 0) AS srid_zero'
+    """
+    return f"COUNT(*) FILTER (WHERE {predicate}) AS {alias}"
+
+
+def index_name(table: str, *columns: str) -> str:
+    """Return a deterministic index name for columns of table.
+
+    Truncated to PostgreSQL's 63 character identifier limit.
+
+    Example:
+        >>> index_name("grid.egon_etrago_bus", "bus_id")
+        'ix_egon_etrago_bus_bus_id'
+    """
+    table_name = table.rsplit(".", 1)[-1]
+    return "_".join(["ix", table_name, *columns])[:63]
@@ -1,11 +1,101 @@
 import os
-import json
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from egon_validation import jsonio
+from egon_validation.logging_config import get_logger
 from egon_validation.rules.registry import list_registered
 from egon_validation.runner.coverage_analysis import calculate_coverage_stats
 
+logger = get_logger("aggregate")
+
+# Below this many result files collect() reads them sequentially; the thread
+# pool only pays off for larger run trees (or slow network filesystems).
+PARALLEL_READ_THRESHOLD = 16
+
+# Result items are encoded and written this many at a time, so results.json
+# never exists as one big string in memory.
+RESULTS_CHUNK_SIZE = 10_000
+
+
+def _base_task_name(task_name: str) -> str:
+    """Strip a timestamp suffix from a task directory name.
+
+    Task names are like: FinalValidations.gas_links.20260127T121919
+    Base name would be: FinalValidations.gas_links
+    """
+    parts = task_name.rsplit(".", 1)
+    if len(parts) == 2 and len(parts[1]) == 15 and parts[1][8] == "T":
+        # Looks like a timestamp suffix (YYYYMMDDTHHMMSS)
+        return parts[0]
+    return task_name
+
+
+def _iter_task_tree(base: str) -> Iterator[Tuple[str, str, str]]:
+    """Walk tasks/<task_name>/<rule_id>/ in one os.scandir pass.
+
+    Yields ("result", task_name, path) for every <rule_id>/results.jsonl and
+    then ("expected", task_name, path) if the task has expected_rules.json.
+    """
+    with os.scandir(base) as task_entries:
+        for task in task_entries:
+            if not task.is_dir():
+                continue
+            expected_file = None
+            with os.scandir(task.path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        path = os.path.join(entry.path, "results.jsonl")
+                        if os.path.isfile(path):
+                            yield "result", task.name, path
+                    elif entry.name == "expected_rules.json" and entry.is_file():
+                        expected_file = entry.path
+            if expected_file:
+                yield "expected", task.name, expected_file
+
+
+def _read_last_json_line(path: str, chunk_size: int = 8192) -> Optional[Any]:
+    """Decode the last non-empty line of a JSONL file.
+
+    Reads backwards from the end in chunks, so only the tail of files that
+    grow across runs is read. Returns None for an empty file.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        while pos > 0:
+            size = min(chunk_size, pos)
+            pos -= size
+            f.seek(pos)
+            buf = f.read(size) + buf
+            tail = buf.rstrip()
+            nl = tail.rfind(b"\n")
+            if nl != -1:
+                return jsonio.loads(tail[nl + 1 :])
+    tail = buf.strip()
+    return jsonio.loads(tail) if tail else None
+
+
+def _try_read_last_json_line(path: str) -> Optional[Any]:
+    try:
+        return _read_last_json_line(path)
+    except (OSError, ValueError) as e:
+        logger.warning(
+            f"Skipping unreadable result file {path}: {e}",
+            extra={"path": path, "error": str(e)},
+        )
+        return None
+
+
+def _read_results(paths: List[str]) -> List[Optional[Any]]:
+    """Read the last record of each results.jsonl, in the order of paths."""
+    if len(paths) < PARALLEL_READ_THRESHOLD:
+        return [_try_read_last_json_line(p) for p in paths]
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # map() keeps input order, which the rule_id dedup below relies on
+        return list(executor.map(_try_read_last_json_line, paths))
+
 
 def collect(ctx) -> Dict:
     """
@@ -41,62 +131,53 @@ def collect(ctx) -> Dict:
     else:
         run_dirs = []
 
+    # structure: tasks/<task_name>/<rule_id>/results.jsonl
+    entries = []
     for run_id in run_dirs:
         base = os.path.join(ctx.out_dir, run_id, "tasks")
 
         if not os.path.isdir(base):
             continue
 
-        # structure: tasks/<task_name>/<rule_id>/results.jsonl
-        for task_dir_path in glob.glob(os.path.join(base, "*")):
-            if not os.path.isdir(task_dir_path):
-                continue
-
-            task_name = os.path.basename(task_dir_path)
+        entries.extend(_iter_task_tree(base))
 
-            # Extract base task name without timestamp for expected_rules dedup
-            # Task names are like: FinalValidations.gas_links.20260127T121919
-            # Base name would be: FinalValidations.gas_links
-            parts = task_name.rsplit(".", 1)
-            if len(parts) == 2 and len(parts[1]) == 15 and parts[1][8] == "T":
-                # Looks like a timestamp suffix (YYYYMMDDTHHMMSS)
-                base_task_name = parts[0]
-            else:
-                base_task_name = task_name
+    results = iter(
+        _read_results([path for kind, _, path in entries if kind == "result"])
+    )
 
+    for kind, task_name, path in entries:
+        if kind == "result":
             # Collect results for this task, deduplicating by rule_id
-            for path in glob.glob(os.path.join(task_dir_path, "*", "results.jsonl")):
+            obj = next(results)
+            if obj is None:
+                continue
+            try:
+                rule_id = obj.get("rule_id")
+
+                # Skip if we already have a result for this rule_id
+                # from a more recent run
+                if rule_id and rule_id in seen_rule_ids:
+                    continue
+
+                if rule_id:
+                    seen_rule_ids.add(rule_id)
+
+                items.append(obj)
+                table = obj.get("table")
+                datasets_set.add(table)
+            except Exception:
+                pass
+            continue
+
+        # Collect expected rules for this task (deduplicate by base task name)
+        base_task_name = _base_task_name(task_name)
+        if base_task_name not in seen_expected_tasks:
+            try:
                 with open(path, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
-                    if lines:
-                        try:
-                            obj = json.loads(lines[-1])
-                            rule_id = obj.get("rule_id")
-
-                            # Skip if we already have a result for this rule_id
-                            # from a more recent run
-                            if rule_id and rule_id in seen_rule_ids:
-                                continue
-
-                            if rule_id:
-                                seen_rule_ids.add(rule_id)
-
-                            items.append(obj)
-                            table = obj.get("table")
-                            datasets_set.add(table)
-                        except Exception:
-                            pass
-
-            # Collect expected rules for this task (deduplicate by base task name)
-            if base_task_name not in seen_expected_tasks:
-                expected_file = os.path.join(task_dir_path, "expected_rules.json")
-                if os.path.exists(expected_file):
-                    try:
-                        with open(expected_file, "r", encoding="utf-8") as f:
-                            expected_rules[base_task_name] = json.load(f)
-                            seen_expected_tasks.add(base_task_name)
-                    except Exception:
-                        pass
+                    expected_rules[base_task_name] = jsonio.load(f)
+                    seen_expected_tasks.add(base_task_name)
+            except Exception:
+                pass
 
     return {
         "items": items,
@@ -156,23 +237,19 @@ def _build_custom_checks_map(
                     tag_ids.add(rule["rule_id"])
     else:
         # Fallback: Use registry
-        reg = list_registered()
-        tag_ids = {r["rule_id"] for r in reg if r.get("kind") in tag_kinds}
+        # Registry kinds are "formal"/"custom"; "sanity" only comes from pipelines
+        tag_ids = {r["rule_id"] for r in list_registered(kind="custom")}
 
-    m: Dict[str, List[str]] = {}
+    m: Dict[str, Set[str]] = {}
     for it in items:
-        if it.get("rule_id") in tag_ids:
+        name = it.get("rule_id")
+        if name in tag_ids:
             tbl = it.get("table")
             if not tbl:
                 continue
-            m.setdefault(tbl, [])
-            name = it.get("rule_id")
-            if name not in m[tbl]:
-                m[tbl].append(name)
+            m.setdefault(tbl, set()).add(name)
     # sort rule names for stable output
-    for tbl in m:
-        m[tbl].sort()
-    return m
+    return {tbl: sorted(names) for tbl, names in m.items()}
 
 
 def build_coverage(ctx, collected: Dict) -> Dict:
@@ -183,49 +260,41 @@ def build_coverage(ctx, collected: Dict) -> Dict:
     # All formal rule classes - from collected items
     rules_formal = _build_formal_rules_index(items)
 
-    # default status/title for every pair
-    status = {}  # (dataset, rule_class) -> "na" | "ok" | "fail"
-    titles = {}  # (dataset, rule_class) -> tooltip text
-    for ds in datasets:
-        for rule_class in rules_formal:
-            status[(ds, rule_class)] = "na"
-            titles[(ds, rule_class)] = "Not applied"
-
-    # apply results
+    # (dataset, rule_class) -> (status, title) for applied pairs only
+    applied = {}
+    failed = set()
+    formal_classes = set(rules_formal)
     for it in items:
         rule_class = it.get("rule_class")
         tbl = it.get("table")
-        if tbl and rule_class in rules_formal:
-            ok = bool(it.get("success", False))
-            msg = it.get("message") or ""
+        if tbl and rule_class in formal_classes:
             key = (tbl, rule_class)
             # if multiple results for same pair exist: any fail dominates
-            if not ok:
-                status[key] = "fail"
+            if not it.get("success", False):
                 # Truncate long error messages for tooltip display
+                msg = it.get("message") or ""
                 if msg:
                     # Extract first line or first 100 chars for tooltip
                     first_line = msg.split("\n")[0]
-                    titles[key] = first_line[:100] + (
-                        "..." if len(first_line) > 100 else ""
-                    )
+                    title = first_line[:100] + ("..." if len(first_line) > 100 else "")
                 else:
-                    titles[key] = "Applied: failed"
-            else:
+                    title = "Applied: failed"
+                applied[key] = ("fail", title)
+                failed.add(key)
+            elif key not in failed:
                 # only set OK if we don't already have a fail
-                if status.get(key) != "fail":
-                    status[key] = "ok"
-                    titles[key] = "Applied: passed"
+                applied[key] = ("ok", "Applied: passed")
 
+    # Only applied pairs are emitted; the report renders every other
+    # (dataset, rule) pair as "na" / "Not applied"
     cells = [
         {
             "dataset": ds,
             "rule_id": rule_class,  # Keep field name for compatibility with JS
-            "status": status[(ds, rule_class)],
-            "title": titles[(ds, rule_class)],
+            "status": status,
+            "title": title,
         }
-        for ds in datasets
-        for rule_class in rules_formal
+        for (ds, rule_class), (status, title) in applied.items()
     ]
 
     custom_checks = _build_custom_checks_map(items, expected_rules)
@@ -245,12 +314,29 @@ def build_coverage(ctx, collected: Dict) -> Dict:
     return cov
 
 
+def _write_results_json(results: Dict, f, chunk_size: Optional[int] = None) -> None:
+    """Write results as JSON with one item per line, in chunks of items."""
+    chunk_size = chunk_size or RESULTS_CHUNK_SIZE
+    items = results.get("items", [])
+    f.write('{"items": [')
+    for start in range(0, len(items), chunk_size):
+        chunk = items[start : start + chunk_size]
+        if start:
+            f.write(",")
+        f.write(",".join("\n" + jsonio.dumps(it) for it in chunk))
+    f.write("\n]")
+    for key, value in results.items():
+        if key != "items":
+            f.write(f",\n{jsonio.dumps(key)}: {jsonio.dumps(value)}")
+    f.write("}\n")
+
+
 def write_outputs(ctx, results: Dict, coverage: Dict) -> str:
     task_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     out_dir = os.path.join(ctx.out_dir, ctx.run_id, f"final.{task_timestamp}")
     os.makedirs(out_dir, exist_ok=True)
     with open(os.path.join(out_dir, "results.json"), "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+        _write_results_json(results, f)
     with open(os.path.join(out_dir, "coverage.json"), "w", encoding="utf-8") as f:
-        json.dump(coverage, f, ensure_ascii=False, indent=2)
+        jsonio.dump(coverage, f)
     return out_dir
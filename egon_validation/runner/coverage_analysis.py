@@ -4,103 +4,82 @@ Coverage analysis for validation monitoring
 
 import os
 import json
-import inspect
-import importlib
-import pkgutil
-from pathlib import Path
-from typing import Dict, Set
+from collections import Counter
+from typing import Dict, FrozenSet
 from egon_validation.db import make_engine, fetch_one
 from egon_validation.config import get_env, ENV_DB_URL, build_db_url
-from egon_validation.rules.base import Rule
+from egon_validation.rules.base import rule_subclasses
 from egon_validation.logging_config import get_logger
 
 logger = get_logger("coverage_analysis")
 
+RULE_PACKAGES = ("egon_validation.rules.formal", "egon_validation.rules.custom")
 
-def discover_all_rule_classes() -> Set[str]:
+
+def discover_all_rule_classes() -> FrozenSet[str]:
     """
-    Discover all rule classes in the codebase by introspecting rules/formal and rules/custom.
+    Discover all rule classes in the codebase, i.e. in rules/formal and rules/custom.
+
+    Rule subclasses record themselves when they are defined, so this only
+    filters that list by module instead of walking and inspecting the packages.
+    The result is not cached: the filter is a single pass over the recorded
+    classes, and rule modules imported later in the process are picked up.
 
     Returns:
     --------
-    Set[str]: Set of all rule class names (e.g., 'RowCountValidation', 'ArrayCardinalityValidation')
+    FrozenSet[str]: All rule class names (e.g., 'RowCountValidation', 'ArrayCardinalityValidation')
     """
-    rule_classes = set()
+    # Importing the packages imports (and so defines) all of their rules
+    import egon_validation.rules.formal  # noqa: F401
+    import egon_validation.rules.custom  # noqa: F401
 
-    try:
-        # Import rules modules to ensure all rules are loaded
-        import egon_validation.rules.formal  # noqa: F401
-        import egon_validation.rules.custom  # noqa: F401
-
-        # Discover rule classes in formal and custom modules
-        for module_name in [
-            "egon_validation.rules.formal",
-            "egon_validation.rules.custom",
-        ]:
-            try:
-                module = importlib.import_module(module_name)
-                module_path = Path(module.__file__).parent
-
-                # Iterate through all Python files in the module
-                for submodule_info in pkgutil.iter_modules([str(module_path)]):
-                    if submodule_info.ispkg or submodule_info.name.startswith("_"):
-                        continue
-
-                    # Import the submodule
-                    submodule = importlib.import_module(
-                        f"{module_name}.{submodule_info.name}"
-                    )
-
-                    # Find all Rule subclasses in the module
-                    for name, obj in inspect.getmembers(submodule, inspect.isclass):
-                        # Check if it's a Rule subclass and not the base Rule class itself
-                        if (
-                            issubclass(obj, Rule)
-                            and obj is not Rule
-                            and obj.__module__ == submodule.__name__
-                        ):
-                            rule_classes.add(obj.__name__)
-                            logger.debug(
-                                f"Discovered rule class: {obj.__name__} in {submodule.__name__}"
-                            )
-
-            except Exception as e:
-                logger.warning(f"Failed to discover rules in {module_name}: {e}")
-
-        logger.info(
-            f"Discovered {len(rule_classes)} total rule classes: {sorted(rule_classes)}"
-        )
-
-    except Exception as e:
-        logger.error(f"Failed to discover rule classes: {e}", exc_info=True)
+    rule_classes = set()
+    for cls in rule_subclasses():
+        package, _, module = cls.__module__.rpartition(".")
+        # Only public modules directly in the rule packages, as auto-imported
+        if package in RULE_PACKAGES and not module.startswith("_"):
+            rule_classes.add(cls.__name__)
 
-    return rule_classes
+    logger.info(
+        f"Discovered {len(rule_classes)} total rule classes: {sorted(rule_classes)}"
+    )
+    return frozenset(rule_classes)
 
 
-def discover_total_tables() -> int:
+def discover_total_tables(engine=None) -> int:
     """
     Discover total number of tables in the database (excluding system schemas)
 
+    Parameters:
+    -----------
+    engine: Optional open engine to reuse; without one, a temporary engine is
+        created from the configured database URL and disposed afterwards
+
     Returns:
     --------
     int: Total number of tables, 0 if database is unavailable
     """
     try:
         logger.info("Attempting to discover total tables in database")
-        db_url = get_env(ENV_DB_URL) or build_db_url()
-        if not db_url:
-            logger.warning("No database URL available - cannot count tables")
-            return 0
-
-        logger.debug("Connecting to database to count tables")
-        engine = make_engine(db_url)
+        own_engine = engine is None
+        if own_engine:
+            db_url = get_env(ENV_DB_URL) or build_db_url()
+            if not db_url:
+                logger.warning("No database URL available - cannot count tables")
+                return 0
+
+            logger.debug("Connecting to database to count tables")
+            engine = make_engine(db_url)
         query = """
         SELECT COUNT(*) as total_tables
         FROM pg_tables
         WHERE schemaname NOT IN ('information_schema', 'pg_catalog', 'pg_toast')
         """
-        result = fetch_one(engine, query)
-        engine.dispose()
+        try:
+            result = fetch_one(engine, query)
+        finally:
+            if own_engine:
+                engine.dispose()
 
         total_tables = result.get("total_tables", 0)
         logger.info(f"Successfully discovered {total_tables} tables in database")
@@ -160,7 +139,11 @@ def calculate_coverage_stats(collected_data: Dict, ctx=None) -> Dict:
     if ctx:
         logger.debug("Attempting to load saved table count from metadata")
         total_tables = load_saved_table_count(ctx)
-    if total_tables == 0:
+    if total_tables == 0 and ctx is not None and ctx.offline:
+        logger.info("Offline run: skipping table discovery, total tables unknown")
+    elif total_tables == 0 and not items:
+        logger.info("No validation results collected, skipping table discovery")
+    elif total_tables == 0:
         logger.debug("No saved table count found, discovering from database")
         total_tables = discover_total_tables()
 
@@ -187,34 +170,26 @@ def calculate_coverage_stats(collected_data: Dict, ctx=None) -> Dict:
     )
 
     # Count unique applied rules by rule_class (not rule_id)
-    applied_rule_classes = set()
-    rule_class_application_count = {}
-    successful_applications = 0
-    failed_applications = 0
-
-    for item in items:
-        # Count all items for pass/fail statistics
-        if item.get("success", False):
-            successful_applications += 1
-        else:
-            failed_applications += 1
+    rule_class_application_count = Counter(
+        rule_class
+        for rule_class in (item.get("rule_class") for item in items)
+        if rule_class
+    )
+    applied_rule_classes = set(rule_class_application_count)
+
+    # Count all items for pass/fail statistics
+    successful_applications = sum(1 for item in items if item.get("success", False))
+    failed_applications = len(items) - successful_applications
 
-        # Track rule_class for coverage analysis
-        rule_class = item.get("rule_class")
-        if rule_class:
-            applied_rule_classes.add(rule_class)
-            rule_class_application_count[rule_class] = (
-                rule_class_application_count.get(rule_class, 0) + 1
-            )
+    # External rule classes are applied but not discovered in codebase (pipeline rules)
+    external_rules = applied_rule_classes - all_rule_classes
 
-    # Total rules = union of discovered rules + applied rules (to include external/pipeline rules)
-    total_rule_classes = all_rule_classes.union(applied_rule_classes)
-    total_rules = len(total_rule_classes)
+    # Total rules = union of discovered rules + applied rules; the two parts are
+    # disjoint, so the union does not need to be built
+    total_rules = len(all_rule_classes) + len(external_rules)
 
     applied_rules_count = len(applied_rule_classes)
 
-    # Log any external rule classes (not discovered in codebase)
-    external_rules = applied_rule_classes - all_rule_classes
     if external_rules:
         logger.info(
             f"Detected {len(external_rules)} external rule classes from pipeline projects: {sorted(external_rules)}"
@@ -235,15 +210,12 @@ def calculate_coverage_stats(collected_data: Dict, ctx=None) -> Dict:
         else 0
     )
 
-    # Rule application statistics - grouped by rule_class
-    rule_stats = []
-    for rule_class in sorted(applied_rule_classes):
-        rule_stats.append(
-            {
-                "rule_class": rule_class,
-                "applications": rule_class_application_count[rule_class],
-            }
-        )
+    # Rule application statistics - grouped by rule_class, sorted by name so
+    # the report and coverage.json are stable across runs
+    rule_stats = [
+        {"rule_class": rule_class, "applications": applications}
+        for rule_class, applications in sorted(rule_class_application_count.items())
+    ]
 
     coverage_stats = {
         "table_coverage": {
@@ -1,18 +1,21 @@
-import json
+import hashlib
 import os
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from egon_validation.rules.registry import rules_for
 from egon_validation.rules.base import SqlRule, RuleResult, Severity
-from egon_validation import db
+from egon_validation import db, jsonio
 from egon_validation.exceptions import (
     RuleExecutionError,
     ValidationTimeoutError,
     RunIdCollisionError,
 )
 from egon_validation.logging_config import get_logger
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError, OperationalError, TimeoutError
 import egon_validation.rules.formal  # noqa: F401
 import egon_validation.rules.custom  # noqa: F401
@@ -24,38 +27,185 @@ logger = get_logger("runner")
 # Matches database connection pool size (DEFAULT_POOL_SIZE - 1)
 DEFAULT_MAX_WORKERS = 6
 
+# Opt-in (cache_results=True): query results are reused within a process
+# while the database has not been written to. This only helps callers that run
+# validations repeatedly in one process; the CLI runs one task per process.
+# The WAL position advances on every write (including TRUNCATE and DROP), so
+# it is a conservative marker for "nothing changed since last run". Entries
+# are keyed by a digest of the SQL text plus the database URL and WAL position,
+# so rules that render the same query (e.g. one table registered under several
+# tasks) share one entry.
+RESULT_CACHE_SIZE = 256
+_RESULT_CACHE: "OrderedDict[Tuple[bytes, str], Dict[str, Any]]" = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def _write_marker(engine) -> Optional[str]:
+    """Return "<database url>@<WAL position>", or None if it cannot be read.
+
+    Read on a plain connection rather than db.fetch_one: a missing marker only
+    disables the cache and must not go through its retries or count towards
+    its circuit breaker. Standbys (in recovery) have no write position, so
+    caching is off for them. The LSN alone does not identify a database
+    (restored clones, fresh instances), hence the URL.
+    """
+    try:
+        with engine.connect() as conn:
+            lsn = conn.execute(
+                text(
+                    "SELECT CASE WHEN pg_is_in_recovery() THEN NULL"
+                    " ELSE pg_current_wal_lsn()::text END"
+                )
+            ).scalar()
+    except Exception as e:
+        logger.debug(f"Result cache disabled, no write marker: {e}")
+        return None
+    if lsn is None:
+        logger.debug("Result cache disabled, database is in recovery")
+        return None
+    return f"{engine.url!r}@{lsn}"
+
+
+def _cache_key(query: str, marker: Optional[str]) -> Optional[Tuple[bytes, str]]:
+    """Return the result cache key for query, or None if caching is off."""
+    if not marker:
+        return None
+    return hashlib.blake2b(query.encode("utf-8"), digest_size=16).digest(), marker
+
+
+def _cached_row(key: Optional[Tuple[bytes, str]]) -> Optional[Dict[str, Any]]:
+    if key is None:
+        return None
+    with _RESULT_CACHE_LOCK:
+        row = _RESULT_CACHE.get(key)
+        if row is None:
+            return None
+        _RESULT_CACHE.move_to_end(key)
+        return dict(row)
+
+
+def _store_row(key: Optional[Tuple[bytes, str]], row: Dict[str, Any]) -> None:
+    if key is None:
+        return
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[key] = dict(row)
+        _RESULT_CACHE.move_to_end(key)
+        while len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+
+
+def _check_pool_size(engine, max_workers: int) -> None:
+    """Warn if the engine's pool keeps fewer connections than there are workers.
+
+    Workers beyond the pool size use overflow connections, which are opened
+    and closed for every query.
+    """
+    try:
+        pool_size = int(engine.pool.size())
+    except (AttributeError, TypeError):
+        return  # Not a QueuePool (e.g. NullPool), nothing to size
+    if pool_size < max_workers:
+        logger.warning(
+            f"Connection pool size {pool_size} is smaller than max_workers "
+            f"{max_workers}; create the engine with make_engine(..., "
+            f"pool_size={max_workers + 1})",
+            extra={"pool_size": pool_size, "max_workers": max_workers},
+        )
+
 
 def _ensure_dir(path: str, check_collision: bool = True) -> None:
     """Create directory, optionally checking for run_id collisions."""
-    if check_collision and os.path.exists(path):
-        # Check if there are existing result files
-        jsonl_files = [f for f in os.listdir(path) if f.endswith(".jsonl")]
-        if jsonl_files:
+    if check_collision and os.path.isdir(path):
+        # Check if there are existing result files, stopping at the first one
+        with os.scandir(path) as entries:
+            has_results = any(
+                e.name.endswith(".jsonl") and e.is_file() for e in entries
+            )
+        if has_results:
             raise RunIdCollisionError(f"Run directory already exists with data: {path}")
     os.makedirs(path, exist_ok=True)
 
 
-def _execute_single_rule(engine, rule, ctx) -> RuleResult:
-    """Execute a single rule and return the result."""
-    start_time = time.time()
+def _error_result(
+    rule, message: str, severity: Severity, execution_time: float
+) -> RuleResult:
+    """Failed result for a rule whose execution raised."""
+    return RuleResult(
+        rule_id=rule.rule_id,
+        task=rule.task,
+        table=rule.table,
+        success=False,
+        observed=None,
+        expected=None,
+        message=message,
+        severity=severity,
+        execution_time=execution_time,
+        executed_at=datetime.now().isoformat(),
+        schema=getattr(rule, "schema", None),
+        table_name=getattr(rule, "table_name", None),
+        kind=getattr(rule, "kind", "unknown"),
+        rule_class=rule.__class__.__name__,
+    )
+
+
+def _execute_single_rule(
+    engine,
+    rule,
+    ctx,
+    marker: Optional[str] = None,
+    prefetched: Optional[Dict[str, Any]] = None,
+    table_rows: Optional[Dict[str, bool]] = None,
+) -> RuleResult:
+    """Execute a single rule and return the result.
+
+    If a write marker is given, SQL results are looked up in and stored to
+    the process-wide result cache. A prefetched row (from a per-table batch)
+    replaces the rule's own query and empty-table check. table_rows caches
+    the empty-table check per table across the rules of one run.
+    """
+    start_time = time.perf_counter()
     try:
         if isinstance(rule, SqlRule):
-            # Check if table is empty first
-            empty_result = rule._check_table_empty(engine, ctx)
-            if empty_result:
-                execution_time = time.time() - start_time
-                empty_result.execution_time = execution_time
-                empty_result.executed_at = datetime.now().isoformat()
-                # Ensure rule_class is set (backup in case create_result didn't set it)
-                if not empty_result.rule_class:
-                    empty_result.rule_class = rule.__class__.__name__
-                return empty_result
-
-            row = db.fetch_one(engine, rule.get_query(ctx))
-            res = rule.postprocess(row, ctx)
+            query = rule.get_query(ctx)
+            cache_key = _cache_key(query, marker)
+            row = _cached_row(cache_key)
+            if row is None:
+                if prefetched is not None:
+                    row = prefetched
+                else:
+                    # Check if table is empty first
+                    empty_result = rule._check_table_empty(engine, ctx, table_rows)
+                    if empty_result:
+                        execution_time = time.perf_counter() - start_time
+                        empty_result.execution_time = execution_time
+                        empty_result.executed_at = datetime.now().isoformat()
+                        # Ensure rule_class is set (backup in case
+                        # create_result didn't set it)
+                        if not empty_result.rule_class:
+                            empty_result.rule_class = rule.__class__.__name__
+                        return empty_result
+
+                    row = db.fetch_one(engine, query)
+                res = rule.postprocess(row, ctx)
+                # Diagnostic columns are only fetched for failed rules
+                details_query = None if res.success else rule.get_details_query(ctx)
+                if details_query:
+                    # Diagnostics are optional: if they fail, keep the result
+                    try:
+                        detailed = {**row, **db.fetch_one(engine, details_query)}
+                        res, row = rule.postprocess(detailed, ctx), detailed
+                    except Exception as e:
+                        logger.warning(
+                            f"Rule {rule.rule_id} details query failed, "
+                            f"reporting result without details: {e}",
+                            extra={"rule_id": rule.rule_id, "error": str(e)},
+                        )
+                _store_row(cache_key, row)
+            else:
+                res = rule.postprocess(row, ctx)
         else:
             res = rule.evaluate(engine, ctx)  # type: ignore
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         res.execution_time = execution_time
         res.executed_at = datetime.now().isoformat()
         # Set rule class name if not already set
@@ -71,7 +221,7 @@ def _execute_single_rule(engine, rule, ctx) -> RuleResult:
         )
         return res
     except TimeoutError as e:
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         logger.error(
             f"Rule {rule.rule_id} timed out in {execution_time:.2f}s: {str(e)}",
             extra={
@@ -82,7 +232,7 @@ def _execute_single_rule(engine, rule, ctx) -> RuleResult:
         )
         raise ValidationTimeoutError(f"Rule {rule.rule_id} timed out: {str(e)}")
     except (OperationalError, SQLAlchemyError) as e:
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         logger.warning(
             f"Rule {rule.rule_id} database error in {execution_time:.2f}s: {str(e)}",
             extra={
@@ -95,24 +245,11 @@ def _execute_single_rule(engine, rule, ctx) -> RuleResult:
         severity = (
             Severity.ERROR if "connection" in str(e).lower() else Severity.WARNING
         )
-        return RuleResult(
-            rule_id=rule.rule_id,
-            task=rule.task,
-            table=rule.table,
-            success=False,
-            observed=None,
-            expected=None,
-            message=f"Database error: {str(e)}",
-            severity=severity,
-            execution_time=execution_time,
-            executed_at=datetime.now().isoformat(),
-            schema=getattr(rule, "schema", None),
-            table_name=getattr(rule, "table_name", None),
-            kind=getattr(rule, "kind", "unknown"),
-            rule_class=rule.__class__.__name__,
+        return _error_result(
+            rule, f"Database error: {str(e)}", severity, execution_time
         )
     except RuleExecutionError as e:
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         logger.error(
             f"Rule {rule.rule_id} execution error in {execution_time:.2f}s: {str(e)}",
             extra={
@@ -121,24 +258,11 @@ def _execute_single_rule(engine, rule, ctx) -> RuleResult:
                 "error": str(e),
             },
         )
-        return RuleResult(
-            rule_id=rule.rule_id,
-            task=rule.task,
-            table=rule.table,
-            success=False,
-            observed=None,
-            expected=None,
-            message=f"Rule execution error: {str(e)}",
-            severity=Severity.ERROR,
-            execution_time=execution_time,
-            executed_at=datetime.now().isoformat(),
-            schema=getattr(rule, "schema", None),
-            table_name=getattr(rule, "table_name", None),
-            kind=getattr(rule, "kind", "unknown"),
-            rule_class=rule.__class__.__name__,
+        return _error_result(
+            rule, f"Rule execution error: {str(e)}", Severity.ERROR, execution_time
         )
     except Exception as e:
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         logger.error(
             f"Rule {rule.rule_id} unexpected error in {execution_time:.2f}s: {str(e)}",
             extra={
@@ -148,30 +272,86 @@ def _execute_single_rule(engine, rule, ctx) -> RuleResult:
             },
             exc_info=True,
         )
-        return RuleResult(
-            rule_id=rule.rule_id,
-            task=rule.task,
-            table=rule.table,
-            success=False,
-            observed=None,
-            expected=None,
-            message=f"Unexpected error: {str(e)}",
-            severity=Severity.ERROR,
-            execution_time=execution_time,
-            executed_at=datetime.now().isoformat(),
-            schema=getattr(rule, "schema", None),
-            table_name=getattr(rule, "table_name", None),
-            kind=getattr(rule, "kind", "unknown"),
-            rule_class=rule.__class__.__name__,
+        return _error_result(
+            rule, f"Unexpected error: {str(e)}", Severity.ERROR, execution_time
         )
 
 
+def _group_by_table(validations: List) -> List[List]:
+    """Group SQL rules by table, keeping first-seen order.
+
+    Other rules are returned as single-rule groups.
+    """
+    groups: Dict[str, List] = {}
+    units: List[List] = []
+    for rule in validations:
+        if not isinstance(rule, SqlRule):
+            units.append([rule])
+            continue
+        group = groups.get(rule.table)
+        if group is None:
+            group = groups[rule.table] = []
+            units.append(group)
+        group.append(rule)
+    return units
+
+
+def _fetch_fused(engine, rules: List, ctx) -> List[Dict[str, Any]]:
+    """Fetch the result rows of several single-row rule queries at once.
+
+    Each query becomes a scalar subquery returning its row as JSON, so the
+    whole group needs one round trip.
+    """
+    columns = ",\n".join(
+        f"(SELECT row_to_json(q) FROM ({rule.get_query(ctx)}) q LIMIT 1) AS r{i}"
+        for i, rule in enumerate(rules)
+    )
+    row = db.fetch_one(engine, f"SELECT\n{columns}")
+    return [
+        dict(SqlRule.parse_json_result(row.get(f"r{i}")) or {})
+        for i in range(len(rules))
+    ]
+
+
+def _execute_table_batch(
+    engine,
+    rules: List,
+    ctx,
+    marker: Optional[str] = None,
+    table_rows: Optional[Dict[str, bool]] = None,
+) -> List[RuleResult]:
+    """Execute SQL rules on the same table with one fused query.
+
+    Falls back to executing each rule on its own if the table is empty (so
+    every rule reports it) or if the fused query fails.
+    """
+    rows = None
+    if rules[0]._check_table_empty(engine, ctx, table_rows) is None:
+        try:
+            rows = _fetch_fused(engine, rules, ctx)
+        except Exception as e:
+            logger.debug(
+                f"Batch for table {rules[0].table} failed, running rules singly: {e}"
+            )
+    if rows is None:
+        return [
+            _execute_single_rule(engine, rule, ctx, marker, table_rows=table_rows)
+            for rule in rules
+        ]
+    return [
+        _execute_single_rule(engine, rule, ctx, marker, row)
+        for rule, row in zip(rules, rows)
+    ]
+
+
 def run_validations(
     engine,
     ctx,
     validations: List,
     task_name: str,
     max_workers: int = DEFAULT_MAX_WORKERS,
+    batch_by_table: bool = False,
+    cache_results: bool = False,
 ) -> List[RuleResult]:
     """Execute a list of validation rule instances.
 
@@ -184,11 +364,15 @@ def run_validations(
         validations: List of instantiated Rule objects
         task_name: Name of the validation task (for context/output dir)
         max_workers: Number of parallel workers
+        batch_by_table: Fetch the rows of all SQL rules on the same table
+            with one fused query instead of one query per rule
+        cache_results: Reuse SQL rule rows from earlier calls in this process
+            while the database has not been written to
 
     Returns:
         List of RuleResult objects
     """
-    overall_start = time.time()
+    overall_start = time.perf_counter()
     results: List[RuleResult] = []
 
     # Set task name on all validation instances
@@ -210,8 +394,9 @@ def run_validations(
         }
         for v in validations
     ]
-    with open(expected_rules_file, "w") as f:
-        json.dump(expected_rules, f, indent=2)
+    # Compact: only read back by aggregate.collect(), one record per rule
+    with open(expected_rules_file, "w", encoding="utf-8") as f:
+        f.write(jsonio.dumps(expected_rules))
 
     logger.debug(
         f"Saved {len(expected_rules)} expected rules to {expected_rules_file}",
@@ -227,39 +412,70 @@ def run_validations(
         },
     )
 
+    _check_pool_size(engine, max_workers)
+    marker = _write_marker(engine) if cache_results else None
+    # Empty-table checks are shared by all rules on the same table
+    table_rows: Dict[str, bool] = {}
+
+    if batch_by_table:
+        units = _group_by_table(validations)
+    else:
+        units = [[rule] for rule in validations]
+
+    # Create all per-rule directories up front instead of once per result
+    rule_dirs = {v.rule_id: os.path.join(task_dir, v.rule_id) for v in validations}
+    for rule_dir in rule_dirs.values():
+        _ensure_dir(rule_dir, check_collision=False)
+
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all rules for execution
-        future_to_rule = {
-            executor.submit(_execute_single_rule, engine, rule, ctx): rule
-            for rule in validations
-        }
+        # Submit all rules for execution, one future per rule or table batch
+        future_to_rules = {}
+        for unit in units:
+            if len(unit) == 1:
+                future = executor.submit(
+                    _execute_single_rule,
+                    engine,
+                    unit[0],
+                    ctx,
+                    marker,
+                    table_rows=table_rows,
+                )
+            else:
+                future = executor.submit(
+                    _execute_table_batch, engine, unit, ctx, marker, table_rows
+                )
+            future_to_rules[future] = unit
 
         # Collect results as they complete and write to per-rule file
-        for future in as_completed(future_to_rule):
-            rule = future_to_rule[future]
+        for future in as_completed(future_to_rules):
+            unit = future_to_rules[future]
             try:
-                res = future.result()
-                results.append(res)
+                unit_results = future.result()
+                if not isinstance(unit_results, list):
+                    unit_results = [unit_results]
+            except Exception as e:
+                for rule in unit:
+                    logger.error(
+                        f"Failed to get result for rule {rule.rule_id}: {e}",
+                        extra={
+                            "rule_id": rule.rule_id,
+                            "task": task_name,
+                            "error": str(e),
+                        },
+                        exc_info=True,
+                    )
+                continue
 
-                # Create per-rule directory and append to its JSONL file
-                rule_dir = os.path.join(task_dir, rule.rule_id)
-                _ensure_dir(rule_dir, check_collision=False)
-                jsonl_path = os.path.join(rule_dir, "results.jsonl")
+            for rule, res in zip(unit, unit_results):
+                results.append(res)
 
+                # Append to the rule's JSONL file. Opened per result so a task
+                # with many rule_ids never holds more than one handle at a time
+                jsonl_path = os.path.join(rule_dirs[rule.rule_id], "results.jsonl")
                 with open(jsonl_path, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(res.to_dict()) + "\n")
-            except Exception as e:
-                logger.error(
-                    f"Failed to get result for rule {rule.rule_id}: {e}",
-                    extra={
-                        "rule_id": rule.rule_id,
-                        "task": task_name,
-                        "error": str(e),
-                    },
-                    exc_info=True,
-                )
+                    f.write(jsonio.dumps(res.to_dict()) + "\n")
 
-    total_time = time.time() - overall_start
+    total_time = time.perf_counter() - overall_start
     avg_time = total_time / len(results) if results else 0
     logger.info(
         f"Completed {len(results)} validations in {total_time:.2f}s "
@@ -275,7 +491,12 @@ def run_validations(
 
 
 def run_for_task(
-    engine, ctx, task: str, max_workers: int = DEFAULT_MAX_WORKERS
+    engine,
+    ctx,
+    task: str,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    batch_by_table: bool = False,
+    cache_results: bool = False,
 ) -> List[RuleResult]:
     """Execute rules registered for a task (legacy registry-based approach).
 
@@ -287,6 +508,8 @@ def run_for_task(
         ctx: Run context
         task: Task name to look up in registry
         max_workers: Number of parallel workers
+        batch_by_table: Fuse the queries of SQL rules on the same table
+        cache_results: Reuse SQL rule rows from earlier calls in this process
 
     Returns:
         List of RuleResult objects
@@ -295,4 +518,6 @@ def run_for_task(
     if not rules:
         logger.warning(f"No task '{task}' found. Check task name or rule registrations.")
         return []
-    return run_validations(engine, ctx, rules, task, max_workers)
+    return run_validations(
+        engine, ctx, rules, task, max_workers, batch_by_table, cache_results
+    )
@@ -5,6 +5,11 @@ import socket
 from typing import Optional
 from pathlib import Path
 
+# How long start() waits for the forwarded port, and how often it checks.
+# A refused connect on localhost returns immediately, so polling is cheap.
+TUNNEL_TIMEOUT_SECONDS = 10
+TUNNEL_POLL_INTERVAL = 0.1
+
 
 class SSHTunnel:
     """Manages SSH tunnel for database connections"""
@@ -65,12 +70,21 @@ class SSHTunnel:
                 preexec_fn=os.setsid,  # Create new process group
             )
 
-            # Wait for tunnel to establish
-            for _ in range(10):  # 10 second timeout
+            # Wait for tunnel to establish, or for ssh to give up
+            deadline = time.monotonic() + TUNNEL_TIMEOUT_SECONDS
+            while time.monotonic() < deadline:
                 if self.is_port_open(self.local_port):
                     print(f"SSH tunnel established on port {self.local_port}")
                     return True
-                time.sleep(1)
+                if self.process.poll() is not None:
+                    error = self.process.stderr.read().decode(errors="replace")
+                    print(
+                        f"SSH tunnel exited with code {self.process.returncode}: "
+                        f"{error.strip()}"
+                    )
+                    self.process = None
+                    return False
+                time.sleep(TUNNEL_POLL_INTERVAL)
 
             print("SSH tunnel failed to establish within timeout")
             return False
@@ -18,6 +18,20 @@ class TestArrayCardinalityValidation:
         assert "correct_length" in sql
         assert "wrong_length" in sql
         assert "null_arrays" in sql
+        assert "found_lengths" not in sql
+
+    def test_details_query_collects_found_lengths(self):
+        rule = ArrayCardinalityValidation(
+            rule_id="test_rule",
+            table="grid.egon_etrago_load_timeseries",
+            array_column="p_set",
+        )
+        sql = rule.get_details_query(None)
+
+        assert "SELECT DISTINCT cardinality(p_set) AS length" in sql
+        assert "LIMIT 10" in sql
+        assert "as found_lengths" in sql
+        assert "grid.egon_etrago_load_timeseries" in sql
 
     def test_sql_generation_custom_parameters(self):
         rule = ArrayCardinalityValidation(
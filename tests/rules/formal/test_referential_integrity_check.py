@@ -239,3 +239,17 @@ class TestReferentialIntegrityValidation:
         assert result.observed == 5.0
         assert result.rule_id == "cts_region_integrity"
         assert result.column == "nuts3"
+
+    def test_recommended_indexes(self):
+        rule = ReferentialIntegrityValidation(
+            rule_id="test_rule",
+            table="demand.egon_demandregio_cts_ind",
+            fk_column="nuts3",
+            ref_table="boundaries.vg250_krs",
+            ref_column="nuts",
+        )
+
+        assert rule.get_recommended_indexes() == [
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vg250_krs_nuts "
+            "ON boundaries.vg250_krs (nuts)"
+        ]
@@ -13,7 +13,7 @@ class TestSRIDUniqueNonZero:
         sql = rule.get_query(None)
 
         assert "COUNT(DISTINCT ST_SRID(geom))" in sql
-        assert "SUM(CASE WHEN ST_SRID(geom) = 0" in sql
+        assert "COUNT(*) FILTER (WHERE ST_SRID(geom) = 0) AS srid_zero" in sql
         assert "supply.egon_power_plants_pv" in sql
         assert "srids" in sql
         assert "srid_zero" in sql
@@ -120,7 +120,18 @@ class TestSRIDSpecificValidation:
         assert "unique_srids" in sql
         assert "correct_srid_count" in sql
         assert "zero_srid_count" in sql
-        assert "found_srids" in sql
+        assert "found_srids" not in sql
+        assert "grid.egon_mv_grid_district" in sql
+
+    def test_details_query_collects_found_srids(self):
+        rule = SRIDSpecificValidation(
+            rule_id="test_rule", table="grid.egon_mv_grid_district"
+        )
+        sql = rule.get_details_query(None)
+
+        assert "SELECT DISTINCT ST_SRID(geom) AS srid" in sql
+        assert "LIMIT 10" in sql
+        assert "AS found_srids" in sql
         assert "grid.egon_mv_grid_district" in sql
 
     def test_sql_generation_custom_parameters(self):
@@ -13,13 +13,37 @@ class TestValueSetValidation:
 
         assert "ARRAY['active','inactive']" in sql
         assert "COUNT(*) as total_rows" in sql
-        assert "COUNT(CASE WHEN status = ANY" in sql
+        assert "COUNT(*) FILTER (WHERE status = ANY" in sql
 
     def test_sql_generation_empty_values(self):
         rule = ValueSetValidation(rule_id="test_rule", table="test.table")
         sql = rule.get_query(None)
 
-        assert "ARRAY[]" in sql
+        assert "ARRAY[]::text[]" in sql
+
+    def test_sql_generation_escapes_quotes(self):
+        rule = ValueSetValidation(
+            rule_id="test_rule",
+            table="test.table",
+            column="name",
+            expected_values=["O'Brien", "plain"],
+        )
+        sql = rule.get_query(None)
+
+        assert "ARRAY['O''Brien','plain']::text[]" in sql
+
+    def test_sql_uses_params_resolved_after_construction(self):
+        rule = ValueSetValidation(
+            rule_id="test_rule",
+            table="test.table",
+            column="status",
+            expected_values={"region_a": ["a1"], "region_b": ["b1", "b2"]},
+        )
+        rule.params["expected_values"] = rule.params["expected_values"]["region_b"]
+        sql = rule.get_query(None)
+
+        assert "ARRAY['b1','b2']::text[]" in sql
+        assert "region_a" not in sql
 
     def test_postprocess_all_valid(self):
         rule = ValueSetValidation(
@@ -1,7 +1,13 @@
 import pytest
 from unittest.mock import patch
 
-from egon_validation.rules.base import Rule, SqlRule, RuleResult, Severity
+from egon_validation.rules.base import (
+    Rule,
+    SqlRule,
+    RuleResult,
+    Severity,
+    static_query,
+)
 
 
 class TestRuleResult:
@@ -139,21 +145,50 @@ class TestSqlRule:
         with pytest.raises(NotImplementedError):
             rule.postprocess({}, None)
 
+    def test_static_query_builds_once(self):
+        calls = []
+
+        class StaticRule(SqlRule):
+            @static_query
+            def get_query(self, ctx):
+                calls.append(ctx)
+                return f"SELECT COUNT(*) FROM {self.table}"
+
+        rule = StaticRule(rule_id="test_rule", table="test.table")
+
+        assert rule.get_query(None) == "SELECT COUNT(*) FROM test.table"
+        assert rule.get_query(None) is rule.get_query(None)
+        assert len(calls) == 1
+
+    def test_builtin_rules_are_slotted(self):
+        from egon_validation.rules.formal.value_set_check import ValueSetValidation
+
+        rule = ValueSetValidation(
+            rule_id="test_rule", table="test.table", expected_values=["a"]
+        )
+
+        assert not hasattr(rule, "__dict__")
+        with pytest.raises(AttributeError):
+            rule.unknown = 1
+
     @patch("egon_validation.db.fetch_one")
     def test_check_table_empty_with_data(
         self, mock_fetch_one, mock_engine, mock_context
     ):
-        mock_fetch_one.return_value = {"total_count": 100}
+        mock_fetch_one.return_value = {"has_rows": True}
 
         rule = SqlRule(rule_id="test_rule", table="test.table", task="test_task")
         result = rule._check_table_empty(mock_engine, mock_context)
 
         assert result is None  # Table has data, continue validation
         mock_fetch_one.assert_called_once()
+        sql = mock_fetch_one.call_args[0][1]
+        assert "EXISTS (SELECT 1 FROM test.table)" in sql
+        assert "COUNT(*)" not in sql
 
     @patch("egon_validation.db.fetch_one")
     def test_check_table_empty_no_data(self, mock_fetch_one, mock_engine, mock_context):
-        mock_fetch_one.return_value = {"total_count": 0}
+        mock_fetch_one.return_value = {"has_rows": False}
 
         rule = SqlRule(rule_id="test_rule", table="test.table", task="test_task")
         result = rule._check_table_empty(mock_engine, mock_context)
@@ -165,9 +200,25 @@ class TestSqlRule:
         assert "EMPTY TABLE" in result.message
         assert result.severity == Severity.WARNING  # auto-set from success=False
 
+    @patch("egon_validation.db.fetch_one")
+    def test_check_table_empty_shared_per_table(
+        self, mock_fetch_one, mock_engine, mock_context
+    ):
+        mock_fetch_one.return_value = {"has_rows": False}
+        table_rows = {}
+
+        first = SqlRule(rule_id="rule_a", table="test.table")
+        second = SqlRule(rule_id="rule_b", table="test.table")
+        res_a = first._check_table_empty(mock_engine, mock_context, table_rows)
+        res_b = second._check_table_empty(mock_engine, mock_context, table_rows)
+
+        assert (res_a.rule_id, res_b.rule_id) == ("rule_a", "rule_b")
+        assert table_rows == {"test.table": False}
+        mock_fetch_one.assert_called_once()
+
     @patch("egon_validation.db.fetch_one")
     def test_check_empty_table(self, mock_fetch_one, mock_engine, mock_context):
-        mock_fetch_one.return_value = {"total_count": 0}
+        mock_fetch_one.return_value = {"has_rows": False}
 
         rule = SqlRule(
             rule_id="test_rule",
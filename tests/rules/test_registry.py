@@ -4,6 +4,9 @@ from egon_validation.rules.registry import (
     rules_for,
     list_registered,
     _REGISTRY,
+    _BY_TASK,
+    _BY_TASK_KIND,
+    _BY_KIND,
 )
 from egon_validation.rules.base import Rule, SqlRule
 
@@ -25,12 +28,24 @@ class MockSqlRule(SqlRule):
         return self.create_result(success=True)
 
 
+class MockCustomRule(MockRule):
+    """Mock rule that reports kind "custom" like rules in rules/custom/."""
+
+    __module__ = "egon_validation.rules.custom.mock_rule"
+
+
 class TestRegistry:
     def setup_method(self):
         _REGISTRY.clear()
+        _BY_TASK.clear()
+        _BY_TASK_KIND.clear()
+        _BY_KIND.clear()
 
     def teardown_method(self):
         _REGISTRY.clear()
+        _BY_TASK.clear()
+        _BY_TASK_KIND.clear()
+        _BY_KIND.clear()
 
     def test_register_decorator_basic(self):
         @register(task="test_task", table="test.table")
@@ -153,6 +168,79 @@ class TestRegistry:
         rule1 = next(rule for rule in rules_task1 if rule.rule_id == "Rule1")
         assert rule1.params["param1"] == "value1"
 
+    def test_rules_for_uses_task_index(self):
+        @register(task="task1", table="table1")
+        class Rule1(MockRule):
+            pass
+
+        register_map(
+            task="task2",
+            rule_cls=MockSqlRule,
+            tables_params={"schema.a": {}, "schema.b": {}},
+        )
+
+        assert [e[0] for e in _BY_TASK["task1"]] == ["Rule1"]
+        assert [e[2] for e in _BY_TASK["task2"]] == ["schema.a", "schema.b"]
+        assert [r.table for r in rules_for("task2")] == ["schema.a", "schema.b"]
+
+    def test_rules_for_returns_fresh_instances(self):
+        @register(task="task1", table="schema.table1", param="value")
+        class Rule1(MockRule):
+            pass
+
+        first = list(rules_for("task1"))
+        first[0].task = "changed"
+        second = list(rules_for("task1"))
+
+        assert first[0] is not second[0]
+        assert second[0].task == "task1"
+        assert second[0].params == {"param": "value"}
+
+    def test_register_after_rules_for(self):
+        @register(task="task1", table="table1")
+        class Rule1(MockRule):
+            pass
+
+        assert [r.rule_id for r in rules_for("task1")] == ["Rule1"]
+
+        @register(task="task1", table="table2")
+        class Rule2(MockRule):
+            pass
+
+        assert [r.rule_id for r in rules_for("task1")] == ["Rule1", "Rule2"]
+
+    def test_rules_for_kind_filter(self):
+        register_map(
+            task="task1",
+            rule_cls=MockRule,
+            tables_params={"schema.a": {}},
+        )
+        register_map(
+            task="task1",
+            rule_cls=MockCustomRule,
+            tables_params={"schema.b": {}, "schema.c": {}},
+        )
+
+        custom = list(rules_for("task1", kind="custom"))
+
+        assert [r.table for r in custom] == ["schema.b", "schema.c"]
+        assert all(r.kind == "custom" for r in custom)
+        assert list(rules_for("task1", kind="formal")) == []
+        assert len(list(rules_for("task1"))) == 3
+
+    def test_list_registered_kind_filter(self):
+        @register(task="task1", table="schema.table1")
+        class Rule1(MockRule):
+            pass
+
+        register(task="task2", table="schema.table2", rule_id="CUSTOM")(MockCustomRule)
+
+        registered = list_registered(kind="custom")
+
+        assert [r["rule_id"] for r in registered] == ["CUSTOM"]
+        assert registered[0]["kind"] == "custom"
+        assert [r["kind"] for r in list_registered()] == ["unknown", "custom"]
+
     def test_rules_for_nonexistent_task(self):
         @register(task="existing_task", table="table1")
         class SomeRule(MockRule):
@@ -0,0 +1,18 @@
+from egon_validation.rules.sql_helpers import count_filter, index_name
+
+
+class TestCountFilter:
+    def test_count_filter(self):
+        sql = count_filter("ST_SRID(geom) = 0", "srid_zero")
+
+        assert sql == "COUNT(*) FILTER (WHERE ST_SRID(geom) = 0) AS srid_zero"
+
+
+class TestIndexName:
+    def test_index_name_drops_schema(self):
+        assert (
+            index_name("grid.egon_etrago_bus", "bus_id") == "ix_egon_etrago_bus_bus_id"
+        )
+
+    def test_index_name_truncated(self):
+        assert len(index_name("s." + "t" * 60, "column")) == 63
@@ -0,0 +1,212 @@
+import io
+import json
+from unittest.mock import patch
+
+from egon_validation.context import RunContext
+from egon_validation.runner import aggregate
+from egon_validation.runner.aggregate import (
+    build_coverage,
+    collect,
+    _build_custom_checks_map,
+    _read_last_json_line,
+    _write_results_json,
+)
+
+
+def _write_result(out_dir, run_id, task, rule_id, *results):
+    rule_dir = out_dir / run_id / "tasks" / task / rule_id
+    rule_dir.mkdir(parents=True, exist_ok=True)
+    with open(rule_dir / "results.jsonl", "a", encoding="utf-8") as f:
+        for res in results:
+            f.write(json.dumps(res) + "\n")
+
+
+def _write_expected(out_dir, run_id, task, rules):
+    task_dir = out_dir / run_id / "tasks" / task
+    task_dir.mkdir(parents=True, exist_ok=True)
+    (task_dir / "expected_rules.json").write_text(json.dumps(rules))
+
+
+class TestCollect:
+    def test_collect_reads_last_result_per_rule(self, tmp_path):
+        _write_result(
+            tmp_path,
+            "run1",
+            "task_a",
+            "RULE_1",
+            {"rule_id": "RULE_1", "table": "s.t1", "success": False},
+            {"rule_id": "RULE_1", "table": "s.t1", "success": True},
+        )
+        _write_result(
+            tmp_path,
+            "run1",
+            "task_a",
+            "RULE_2",
+            {"rule_id": "RULE_2", "table": "s.t2", "success": True},
+        )
+
+        collected = collect(RunContext(run_id="run1", out_dir=tmp_path))
+
+        by_id = {it["rule_id"]: it for it in collected["items"]}
+        assert set(by_id) == {"RULE_1", "RULE_2"}
+        assert by_id["RULE_1"]["success"] is True
+        assert collected["datasets"] == ["s.t1", "s.t2"]
+
+    def test_collect_prefers_current_run_and_strips_task_timestamp(self, tmp_path):
+        _write_result(
+            tmp_path,
+            "run1",
+            "task_a.20260101T000000",
+            "RULE_1",
+            {"rule_id": "RULE_1", "table": "s.t1", "success": False},
+        )
+        _write_expected(
+            tmp_path, "run1", "task_a.20260101T000000", [{"rule_id": "OLD"}]
+        )
+        _write_result(
+            tmp_path,
+            "run0",
+            "task_a.20260102T000000",
+            "RULE_1",
+            {"rule_id": "RULE_1", "table": "s.t1", "success": True},
+        )
+        _write_expected(
+            tmp_path, "run0", "task_a.20260102T000000", [{"rule_id": "NEW"}]
+        )
+
+        collected = collect(RunContext(run_id="run0", out_dir=tmp_path))
+
+        assert [it["success"] for it in collected["items"]] == [True]
+        assert collected["expected_rules"] == {"task_a": [{"rule_id": "NEW"}]}
+
+    def test_collect_parallel_read_keeps_precedence(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(aggregate, "PARALLEL_READ_THRESHOLD", 0)
+        for run_id, success in [("run2", True), ("run1", False)]:
+            for i in range(5):
+                _write_result(
+                    tmp_path,
+                    run_id,
+                    "task_a",
+                    f"RULE_{i}",
+                    {"rule_id": f"RULE_{i}", "table": "s.t", "success": success},
+                )
+
+        collected = collect(RunContext(run_id="run2", out_dir=tmp_path))
+
+        assert len(collected["items"]) == 5
+        assert all(it["success"] for it in collected["items"])
+
+    def test_collect_reads_results_with_bare_nan(self, tmp_path):
+        rule_dir = tmp_path / "run1" / "tasks" / "task_a" / "RULE_1"
+        rule_dir.mkdir(parents=True)
+        (rule_dir / "results.jsonl").write_text(
+            '{"rule_id":"RULE_1","table":"s.t1","observed":NaN}\n'
+        )
+
+        collected = collect(RunContext(run_id="run1", out_dir=tmp_path))
+
+        assert [it["rule_id"] for it in collected["items"]] == ["RULE_1"]
+
+    def test_collect_missing_out_dir(self, tmp_path):
+        collected = collect(RunContext(run_id="run1", out_dir=tmp_path / "missing"))
+
+        assert collected == {"items": [], "datasets": [], "expected_rules": {}}
+
+
+class TestReadLastJsonLine:
+    def test_last_line_across_chunks(self, tmp_path):
+        path = tmp_path / "results.jsonl"
+        lines = [
+            json.dumps({"rule_id": "R", "n": i, "pad": "x" * 20}) for i in range(5)
+        ]
+        path.write_text("\n".join(lines) + "\n")
+
+        assert _read_last_json_line(str(path), chunk_size=16)["n"] == 4
+
+    def test_single_line_without_newline(self, tmp_path):
+        path = tmp_path / "results.jsonl"
+        path.write_text(json.dumps({"n": 1}))
+
+        assert _read_last_json_line(str(path), chunk_size=4) == {"n": 1}
+
+    def test_unreadable_file_is_logged_and_skipped(self, tmp_path, caplog):
+        path = tmp_path / "results.jsonl"
+        path.write_text("{not json\n")
+
+        with caplog.at_level("WARNING"):
+            assert aggregate._try_read_last_json_line(str(path)) is None
+        assert str(path) in caplog.text
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "results.jsonl"
+        path.write_text("")
+
+        assert _read_last_json_line(str(path)) is None
+
+
+class TestBuildCoverage:
+    @patch("egon_validation.runner.aggregate.calculate_coverage_stats")
+    def test_cells_fail_dominates_and_omit_not_applied(self, mock_stats):
+        mock_stats.return_value = {"table_coverage": {"total_tables": 10}}
+        formal = {"kind": "formal", "rule_class": "NotNull"}
+        collected = {
+            "items": [
+                {**formal, "table": "s.a", "success": False, "message": "bad\nmore"},
+                {**formal, "table": "s.a", "success": True},
+                {**formal, "table": "s.b", "success": True},
+            ],
+            "datasets": ["s.a", "s.b", "s.c"],
+        }
+
+        cov = build_coverage(None, collected)
+
+        cells = {c["dataset"]: (c["status"], c["title"]) for c in cov["cells"]}
+        assert cells == {
+            "s.a": ("fail", "bad"),
+            "s.b": ("ok", "Applied: passed"),
+        }
+        assert cov["rules_formal"] == ["NotNull"]
+
+
+class TestCustomChecksMap:
+    def test_dedup_and_sorted_per_table(self):
+        items = [
+            {"rule_id": "B_CHECK", "table": "s.a"},
+            {"rule_id": "A_CHECK", "table": "s.a"},
+            {"rule_id": "B_CHECK", "table": "s.a"},
+            {"rule_id": "FORMAL", "table": "s.a"},
+            {"rule_id": "A_CHECK", "table": None},
+        ]
+        expected_rules = {
+            "task": [
+                {"rule_id": "A_CHECK", "kind": "custom"},
+                {"rule_id": "B_CHECK", "kind": "sanity"},
+                {"rule_id": "FORMAL", "kind": "formal"},
+            ]
+        }
+
+        assert _build_custom_checks_map(items, expected_rules) == {
+            "s.a": ["A_CHECK", "B_CHECK"]
+        }
+
+
+class TestWriteResultsJson:
+    def test_chunked_items_round_trip(self):
+        results = {
+            "items": [{"rule_id": f"R{i}", "message": "Prüfung"} for i in range(5)],
+            "datasets": ["s.a"],
+            "expected_rules": {"task": [{"rule_id": "R0"}]},
+        }
+        f = io.StringIO()
+
+        _write_results_json(results, f, chunk_size=2)
+
+        assert json.loads(f.getvalue()) == results
+        assert f.getvalue().count("\n{") == 5
+
+    def test_empty_items(self):
+        f = io.StringIO()
+
+        _write_results_json({"items": [], "datasets": []}, f)
+
+        assert json.loads(f.getvalue()) == {"items": [], "datasets": []}
@@ -4,6 +4,7 @@ import json
 import tempfile
 from unittest.mock import Mock, patch, mock_open
 from egon_validation.runner.coverage_analysis import (
+    discover_all_rule_classes,
     discover_total_tables,
     load_saved_table_count,
     calculate_coverage_stats,
@@ -11,7 +12,42 @@ from egon_validation.runner.coverage_analysis import (
 from egon_validation.context import RunContext
 
 
+class TestDiscoverAllRuleClasses:
+    def test_discovers_builtin_rule_classes(self):
+        rule_classes = discover_all_rule_classes()
+
+        assert isinstance(rule_classes, frozenset)
+        assert {"NotNullAndNotNaNValidation", "RowCountComparisonValidation"} <= (
+            rule_classes
+        )
+        assert not {"Rule", "SqlRule", "DataFrameRule"} & rule_classes
+
+    def test_ignores_rules_defined_elsewhere(self):
+        from egon_validation.rules.base import SqlRule
+
+        class PipelineRule(SqlRule):
+            pass
+
+        assert "PipelineRule" not in discover_all_rule_classes()
+
+
 class TestDiscoverTotalTables:
+    @patch("egon_validation.runner.coverage_analysis.make_engine")
+    @patch("egon_validation.runner.coverage_analysis.fetch_one")
+    def test_discover_total_tables_reuses_given_engine(
+        self, mock_fetch_one, mock_make_engine
+    ):
+        """Test that a passed engine is used and not disposed"""
+        mock_engine = Mock()
+        mock_fetch_one.return_value = {"total_tables": 7}
+
+        result = discover_total_tables(mock_engine)
+
+        assert result == 7
+        mock_make_engine.assert_not_called()
+        assert mock_fetch_one.call_args[0][0] is mock_engine
+        mock_engine.dispose.assert_not_called()
+
     @patch("egon_validation.runner.coverage_analysis.make_engine")
     @patch("egon_validation.runner.coverage_analysis.fetch_one")
     @patch("egon_validation.runner.coverage_analysis.get_env")
@@ -212,7 +248,7 @@ class TestCalculateCoverageStats:
             "datasets": ["schema1.table1", "schema2.table2"],
         }
 
-        mock_ctx = Mock()
+        mock_ctx = RunContext(run_id="test", out_dir="/tmp")
         result = calculate_coverage_stats(collected_data, mock_ctx)
 
         expected = {
@@ -249,7 +285,7 @@ class TestCalculateCoverageStats:
         mock_discover_rules.return_value = set()
         mock_discover.return_value = 25
 
-        collected_data = {"items": [], "datasets": []}
+        collected_data = {"items": [{"success": True}], "datasets": []}
 
         result = calculate_coverage_stats(collected_data, ctx=None)
 
@@ -267,8 +303,8 @@ class TestCalculateCoverageStats:
         mock_load_saved.return_value = 0
         mock_discover.return_value = 30
 
-        collected_data = {"items": [], "datasets": []}
-        mock_ctx = Mock()
+        collected_data = {"items": [{"success": True}], "datasets": []}
+        mock_ctx = RunContext(run_id="test", out_dir="/tmp")
 
         result = calculate_coverage_stats(collected_data, mock_ctx)
 
@@ -276,6 +312,37 @@ class TestCalculateCoverageStats:
         mock_load_saved.assert_called_once_with(mock_ctx)
         mock_discover.assert_called_once()
 
+    @patch("egon_validation.runner.coverage_analysis.discover_all_rule_classes")
+    @patch("egon_validation.runner.coverage_analysis.load_saved_table_count")
+    @patch("egon_validation.runner.coverage_analysis.discover_total_tables")
+    def test_calculate_coverage_stats_offline_skips_discovery(
+        self, mock_discover, mock_load_saved, mock_discover_rules
+    ):
+        """Test that an offline context never queries the database"""
+        mock_discover_rules.return_value = set()
+        mock_load_saved.return_value = 0
+
+        collected_data = {"items": [], "datasets": []}
+        ctx = RunContext(run_id="test", out_dir="/tmp", offline=True)
+
+        result = calculate_coverage_stats(collected_data, ctx)
+
+        assert result["table_coverage"]["total_tables"] == 0
+        mock_discover.assert_not_called()
+
+    @patch("egon_validation.runner.coverage_analysis.discover_all_rule_classes")
+    @patch("egon_validation.runner.coverage_analysis.discover_total_tables")
+    def test_calculate_coverage_stats_no_items_skips_discovery(
+        self, mock_discover, mock_discover_rules
+    ):
+        """Test that a run without results does not query the database"""
+        mock_discover_rules.return_value = set()
+
+        result = calculate_coverage_stats({"items": [], "datasets": []}, ctx=None)
+
+        assert result["table_coverage"]["total_tables"] == 0
+        mock_discover.assert_not_called()
+
     @patch("egon_validation.runner.coverage_analysis.discover_all_rule_classes")
     def test_calculate_coverage_stats_empty_data(self, mock_discover_rules):
         """Test handling of empty collected data"""
@@ -394,7 +461,7 @@ class TestCalculateCoverageStats:
             "datasets": ["table1", "table2"],
         }
 
-        mock_ctx = Mock()
+        mock_ctx = RunContext(run_id="test", out_dir="/tmp")
         with patch(
             "egon_validation.runner.coverage_analysis.load_saved_table_count",
             return_value=10,
@@ -0,0 +1,15 @@
+import argparse
+
+import pytest
+
+from egon_validation.cli import _positive_int
+
+
+class TestPositiveInt:
+    def test_accepts_positive(self):
+        assert _positive_int("4") == 4
+
+    @pytest.mark.parametrize("value", ["0", "-2", "many"])
+    def test_rejects_invalid(self, value):
+        with pytest.raises(argparse.ArgumentTypeError):
+            _positive_int(value)
@@ -0,0 +1,48 @@
+import io
+
+import pytest
+
+from egon_validation import jsonio
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestJsonio:
+    def test_dumps_single_line_roundtrip(self, backend):
+        obj = {"rule_id": "R", "observed": 1.5, "message": "Größe"}
+
+        line = jsonio.dumps(obj)
+
+        assert line == '{"rule_id":"R","observed":1.5,"message":"Größe"}'
+        assert jsonio.loads(line) == obj
+        assert jsonio.loads(line.encode("utf-8")) == obj
+
+    def test_dump_indented_utf8(self, backend):
+        f = io.StringIO()
+
+        jsonio.dump({"title": "Prüfung", "cells": [1]}, f)
+
+        assert "Prüfung" in f.getvalue()
+        assert '\n  "cells"' in f.getvalue()
+        assert jsonio.loads(f.getvalue()) == {"title": "Prüfung", "cells": [1]}
+
+    def test_non_finite_floats_written_as_null(self, backend):
+        obj = {"observed": float("nan"), "limits": [float("inf"), 1.0]}
+
+        assert jsonio.dumps(obj) == '{"observed":null,"limits":[null,1.0]}'
+        f = io.StringIO()
+        jsonio.dump(obj, f)
+        assert jsonio.loads(f.getvalue()) == {"observed": None, "limits": [None, 1.0]}
+
+    def test_loads_accepts_bare_nan(self, backend):
+        obj = jsonio.loads('{"observed":NaN,"expected":Infinity}')
+
+        assert obj["observed"] != obj["observed"]
+        assert obj["expected"] == float("inf")
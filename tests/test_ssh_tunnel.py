@@ -0,0 +1,41 @@
+from unittest.mock import Mock, patch
+
+from egon_validation.ssh_tunnel import SSHTunnel
+
+
+def _tunnel(tmp_path):
+    key = tmp_path / "id_test"
+    key.write_text("")
+    return SSHTunnel("host", 22, "user", str(key), 15432, 5432)
+
+
+class TestStart:
+    @patch("egon_validation.ssh_tunnel.subprocess.Popen")
+    def test_returns_once_port_opens(self, mock_popen, tmp_path):
+        tunnel = _tunnel(tmp_path)
+        mock_popen.return_value.poll.return_value = None
+
+        with (
+            patch.object(SSHTunnel, "is_port_open", side_effect=[False, False, True]),
+            patch("egon_validation.ssh_tunnel.time.sleep") as mock_sleep,
+        ):
+            assert tunnel.start() is True
+
+        assert mock_sleep.call_count == 1
+
+    @patch("egon_validation.ssh_tunnel.subprocess.Popen")
+    def test_stops_waiting_when_ssh_exits(self, mock_popen, tmp_path):
+        tunnel = _tunnel(tmp_path)
+        process = Mock(returncode=255)
+        process.poll.return_value = 255
+        process.stderr.read.return_value = b"Permission denied (publickey)."
+        mock_popen.return_value = process
+
+        with (
+            patch.object(SSHTunnel, "is_port_open", return_value=False),
+            patch("egon_validation.ssh_tunnel.time.sleep") as mock_sleep,
+        ):
+            assert tunnel.start() is False
+
+        mock_sleep.assert_not_called()
+        assert tunnel.process is None